@@ -1,3 +1,4 @@
-﻿from .repository import SQLiteRepository
+﻿from .json_codec import dumps_compact, loads_json
+from .repository import SQLiteRepository
 
-__all__ = ["SQLiteRepository"]
+__all__ = ["SQLiteRepository", "dumps_compact", "loads_json"]
@@ -2,51 +2,102 @@
 
 from __future__ import annotations
 
-import json
+import os
+import string
+import sys
 from functools import lru_cache
-from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Mapping
+
+from backend.json_codec import loads_json
 
 DEFAULT_PROMPT_LANGUAGE = "zh"
 SUPPORTED_PROMPT_LANGUAGES = {"zh", "en"}
 
+_PROMPT_PATH: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), "llm_prompts.json")
+
+# Common spellings resolved without allocating stripped/lowered copies.
+_LANGUAGE_ALIASES: dict[str | None, str] = {
+    None: DEFAULT_PROMPT_LANGUAGE,
+    "": DEFAULT_PROMPT_LANGUAGE,
+    "zh": "zh",
+    "ZH": "zh",
+    "Zh": "zh",
+    "en": "en",
+    "EN": "en",
+    "En": "en",
+}
+
 
 def normalize_prompt_language(language: str | None) -> str:
+    alias = _LANGUAGE_ALIASES.get(language)
+    if alias is not None:
+        return alias
+
     candidate = (language or DEFAULT_PROMPT_LANGUAGE).strip().lower()
     if candidate in SUPPORTED_PROMPT_LANGUAGES:
         return candidate
     return DEFAULT_PROMPT_LANGUAGE
 
 
-@lru_cache(maxsize=1)
-def _load_prompt_catalog() -> dict[str, dict[str, Any]]:
-    prompt_file = Path(__file__).with_name("llm_prompts.json")
-    with prompt_file.open("r", encoding="utf-8") as handle:
-        payload = json.load(handle)
+def _load_prompt_catalog() -> Mapping[str, Mapping[str, Any]]:
+    with open(_PROMPT_PATH, "rb") as handle:
+        payload = loads_json(handle.read())
 
     if not isinstance(payload, dict):
         raise ValueError("Invalid LLM prompt catalog: top-level value must be an object.")
 
-    catalog: dict[str, dict[str, Any]] = {}
+    catalog: dict[str, Mapping[str, Any]] = {}
     for language, value in payload.items():
         if isinstance(language, str) and isinstance(value, dict):
-            catalog[language] = value
-    return catalog
+            catalog[language] = MappingProxyType(value)
+    return MappingProxyType(catalog)
 
 
-def _resolve_prompt_value(language: str | None, key: str) -> Any:
-    catalog = _load_prompt_catalog()
-    normalized_language = normalize_prompt_language(language)
+def _freeze_prompt_value(value: Any) -> Any:
+    if isinstance(value, list) and all(isinstance(item, str) for item in value):
+        return tuple(value)
+    return value
 
-    primary = catalog.get(normalized_language, {})
-    if key in primary:
-        return primary[key]
 
+def _build_prompt_tables(
+    catalog: Mapping[str, Mapping[str, Any]],
+) -> Mapping[str, Mapping[str, Any]]:
     fallback = catalog.get(DEFAULT_PROMPT_LANGUAGE, {})
-    if key in fallback:
-        return fallback[key]
+    keys: set[str] = set()
+    for prompts in catalog.values():
+        keys.update(sys.intern(key) for key in prompts)
+
+    tables: dict[str, Mapping[str, Any]] = {}
+    for language in SUPPORTED_PROMPT_LANGUAGES:
+        primary = catalog.get(language, {})
+        table: dict[str, Any] = {}
+        for key in keys:
+            if key in primary:
+                table[key] = _freeze_prompt_value(primary[key])
+            elif key in fallback:
+                table[key] = _freeze_prompt_value(fallback[key])
+        tables[sys.intern(language)] = MappingProxyType(table)
+    return MappingProxyType(tables)
+
+
+# The catalog ships with the package and never changes at runtime, so it is
+# parsed once at import and every language gets a complete read-only table,
+# including the fallback to the default language. Keys are interned so the
+# two lookups per fetch compare by identity.
+_CATALOG: Mapping[str, Mapping[str, Any]] = _load_prompt_catalog()
+_PROMPTS_BY_LANGUAGE: Mapping[str, Mapping[str, Any]] = _build_prompt_tables(_CATALOG)
+_MISSING = object()
 
-    raise KeyError(f"Missing LLM prompt key: {key}")
+
+def _resolve_prompt_value(language: str | None, key: str) -> Any:
+    # Hot path for every prompt fetch: the alias table answers the common
+    # spellings inline, so the general normalizer only runs on a miss.
+    normalized_language = _LANGUAGE_ALIASES.get(language) or normalize_prompt_language(language)
+    value = _PROMPTS_BY_LANGUAGE[normalized_language].get(key, _MISSING)
+    if value is _MISSING:
+        raise KeyError(f"Missing LLM prompt key: {key}")
+    return value
 
 
 def get_llm_prompt_text(language: str | None, key: str) -> str:
@@ -58,11 +109,46 @@ def get_llm_prompt_text(language: str | None, key: str) -> str:
 
 def get_llm_prompt_items(language: str | None, key: str) -> tuple[str, ...]:
     value = _resolve_prompt_value(language, key)
-    if isinstance(value, list) and all(isinstance(item, str) for item in value):
-        return tuple(value)
+    if isinstance(value, tuple):
+        return value
     raise TypeError(f"Prompt key `{key}` is not a string list.")
 
 
-def render_llm_prompt_template(language: str | None, key: str, **params: object) -> str:
+_TemplatePart = tuple[str, str | None]
+
+
+@lru_cache(maxsize=256)
+def _compile_prompt_template(language: str, key: str) -> str | tuple[_TemplatePart, ...] | None:
+    """Parse a template once into ``(literal, field_name)`` parts.
+
+    Returns the final text for templates without replacement fields, and
+    ``None`` for templates using format specs, conversions or indexed fields,
+    which keep going through ``str.format``.
+    """
     template = get_llm_prompt_text(language, key)
-    return template.format(**params)
+    parts: list[_TemplatePart] = []
+    for literal, field_name, format_spec, conversion in string.Formatter().parse(template):
+        if field_name is not None and (
+            format_spec or conversion or not field_name.isidentifier()
+        ):
+            return None
+        parts.append((literal, field_name))
+
+    if all(field_name is None for _, field_name in parts):
+        return "".join(literal for literal, _ in parts)
+    return tuple(parts)
+
+
+def render_llm_prompt_template(language: str | None, key: str, **params: object) -> str:
+    compiled = _compile_prompt_template(normalize_prompt_language(language), key)
+    if isinstance(compiled, str):
+        return compiled
+    if compiled is None:
+        return get_llm_prompt_text(language, key).format(**params)
+
+    chunks: list[str] = []
+    for literal, field_name in compiled:
+        chunks.append(literal)
+        if field_name is not None:
+            chunks.append(format(params[field_name]))
+    return "".join(chunks)
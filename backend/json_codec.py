@@ -0,0 +1,25 @@
+"""JSON encode/decode helpers shared by persistence and prompt loading."""
+
+from __future__ import annotations
+
+from typing import Any
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+
+def dumps_compact(value: Any) -> str:
+    """Serialize a JSON column value (UTF-8, no ASCII escaping)."""
+    if orjson is not None:
+        return orjson.dumps(value).decode("utf-8")
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def loads_json(raw: str | bytes) -> Any:
+    """Parse a JSON column value; raises ``json.JSONDecodeError`` on bad input."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
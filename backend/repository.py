@@ -2,30 +2,196 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Iterator, Sequence
+from itertools import islice
+from typing import Any, Iterable, Iterator, Sequence
+import queue
 import sqlite3
+import threading
+
+DEFAULT_POOL_SIZE = 5
+
+# Per-connection LRU of prepared statements keyed by SQL text. The service
+# layer issues a fixed set of queries, so this keeps all of them prepared
+# for the lifetime of each pooled connection.
+STATEMENT_CACHE_SIZE = 256
+
+# Recent fetch_one/fetch_all results kept per repository; 0 disables it.
+DEFAULT_QUERY_CACHE_SIZE = 512
+
+# Rows pulled per fetchmany() call when streaming with iter_rows.
+DEFAULT_FETCH_BATCH_SIZE = 1000
+
+# Stored in `PRAGMA user_version` once the DDL below has been applied.
+# Bump it whenever the schema script changes so existing files pick it up.
+SCHEMA_VERSION = 2
+
+# Rows handed to a single executemany() call by bulk_insert.
+BULK_INSERT_CHUNK_SIZE = 10_000
+
+# Applied once when a pooled connection is opened; they persist for the
+# lifetime of the connection, so reuse does not pay for them again.
+CONNECTION_PRAGMAS: tuple[str, ...] = (
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA cache_size = -65536",
+    "PRAGMA mmap_size = 268435456",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA busy_timeout = 30000",
+    "PRAGMA foreign_keys = ON",
+)
+
+# WAL with synchronous=NORMAL only fsyncs at checkpoints: commits survive a
+# process crash but the last few may be lost on power failure. FULL restores
+# an fsync per commit.
+DEFAULT_SYNCHRONOUS = "NORMAL"
+SYNCHRONOUS_MODES = frozenset({"OFF", "NORMAL", "FULL", "EXTRA"})
 
 
 class SQLiteRepository:
-    """A lightweight transactional repository."""
+    """A lightweight transactional repository.
+
+    Reads are served from a bounded pool of ``query_only`` connections while
+    all writes go through a single dedicated writer connection, so WAL lets
+    readers proceed while a transaction is in flight.
+    """
 
-    def __init__(self, db_path: str = "data/thinking_graph.db") -> None:
+    def __init__(
+        self,
+        db_path: str = "data/thinking_graph.db",
+        pool_size: int = DEFAULT_POOL_SIZE,
+        query_cache_size: int = DEFAULT_QUERY_CACHE_SIZE,
+        synchronous: str = DEFAULT_SYNCHRONOUS,
+    ) -> None:
         self.db_path = Path(db_path)
+        self.synchronous = synchronous.strip().upper()
+        if self.synchronous not in SYNCHRONOUS_MODES:
+            raise ValueError(f"Unsupported SQLite synchronous mode: {synchronous}")
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._pool_size = max(int(pool_size), 1)
+        self._readers: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue(
+            maxsize=self._pool_size
+        )
+        self._pool_lock = threading.Lock()
+        self._opened_readers = 0
+
+        self._writer: sqlite3.Connection | None = None
+        self._writer_lock = threading.Lock()
+
+        # Read results are cached until a write commits. Writes made through
+        # another connection (another repository or process on the same
+        # file) are detected through `PRAGMA data_version` on the leased
+        # reader, checked before any cached result is served. The counter is
+        # per connection, so the last value seen is kept per reader.
+        self._query_cache_size = max(int(query_cache_size), 0)
+        self._query_cache: OrderedDict[tuple[str, str, tuple[object, ...]], Any] = OrderedDict()
+        self._query_cache_lock = threading.Lock()
+        self._query_cache_generation = 0
+        self._seen_data_versions: dict[int, int] = {}
+
         self._init_schema()
 
-    def _connect(self) -> sqlite3.Connection:
-        connection = sqlite3.connect(self.db_path)
+    def _connect(self, *, read_only: bool = False) -> sqlite3.Connection:
+        # Connections are handed to one thread at a time (reader leases and
+        # the writer lock), so sharing them across Flask worker threads is safe.
+        connection = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            cached_statements=STATEMENT_CACHE_SIZE,
+        )
         connection.row_factory = sqlite3.Row
-        connection.execute("PRAGMA foreign_keys = ON")
+        for pragma in CONNECTION_PRAGMAS:
+            connection.execute(pragma)
+        connection.execute(f"PRAGMA synchronous = {self.synchronous}")
+        if read_only:
+            connection.execute("PRAGMA query_only = ON")
         return connection
 
+    def _checkout(self) -> sqlite3.Connection:
+        try:
+            return self._readers.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._pool_lock:
+            can_open = self._opened_readers < self._pool_size
+            if can_open:
+                self._opened_readers += 1
+
+        if not can_open:
+            return self._readers.get()
+
+        try:
+            return self._connect(read_only=True)
+        except Exception:
+            with self._pool_lock:
+                self._opened_readers -= 1
+            raise
+
+    def _checkin(self, conn: sqlite3.Connection) -> None:
+        self._readers.put_nowait(conn)
+
+    def _discard(self, conn: sqlite3.Connection) -> None:
+        self._seen_data_versions.pop(id(conn), None)
+        try:
+            conn.close()
+        finally:
+            with self._pool_lock:
+                self._opened_readers -= 1
+
+    @contextmanager
+    def _lease(self) -> Iterator[sqlite3.Connection]:
+        conn = self._checkout()
+        try:
+            yield conn
+        except GeneratorExit:
+            # Raised when a streaming reader is closed early; the connection
+            # itself is still healthy.
+            self._checkin(conn)
+            raise
+        except BaseException:
+            # A connection that failed mid-use may hold a broken state;
+            # drop it and let the pool open a fresh one on demand.
+            self._discard(conn)
+            raise
+        self._checkin(conn)
+
+    def _writer_connection(self) -> sqlite3.Connection:
+        # Callers must hold `_writer_lock`.
+        if self._writer is None:
+            self._writer = self._connect()
+        return self._writer
+
+    def close(self) -> None:
+        """Close the writer and every idle reader connection."""
+        with self._writer_lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+
+        with self._query_cache_lock:
+            self._query_cache.clear()
+
+        while True:
+            try:
+                conn = self._readers.get_nowait()
+            except queue.Empty:
+                return
+            self._discard(conn)
+
     def _init_schema(self) -> None:
-        with self._connect() as conn:
+        with self._writer_lock:
+            conn = self._writer_connection()
+            current_version = int(conn.execute("PRAGMA user_version").fetchone()[0])
+            if current_version >= SCHEMA_VERSION:
+                return
+
             conn.executescript(
-                """
+                f"""
+                BEGIN;
+
                 CREATE TABLE IF NOT EXISTS nodes (
                     id TEXT PRIMARY KEY,
                     content TEXT NOT NULL,
@@ -34,9 +200,9 @@ class SQLiteRepository:
                     position_y REAL NOT NULL DEFAULT 0,
                     color TEXT NOT NULL DEFAULT '#157f83',
                     size REAL NOT NULL DEFAULT 1,
-                    tags TEXT NOT NULL DEFAULT '[]',
+                    tags TEXT NOT NULL DEFAULT '[]' CHECK (json_valid(tags)),
                     confidence REAL NOT NULL DEFAULT 1,
-                    evidence TEXT NOT NULL DEFAULT '[]',
+                    evidence TEXT NOT NULL DEFAULT '[]' CHECK (json_valid(evidence)),
                     created_at TEXT NOT NULL,
                     updated_at TEXT NOT NULL,
                     version INTEGER NOT NULL DEFAULT 1,
@@ -72,7 +238,7 @@ class SQLiteRepository:
 
                 CREATE TABLE IF NOT EXISTS graph_snapshots (
                     name TEXT PRIMARY KEY,
-                    payload TEXT NOT NULL,
+                    payload TEXT NOT NULL CHECK (json_valid(payload)),
                     node_count INTEGER NOT NULL DEFAULT 0,
                     connection_count INTEGER NOT NULL DEFAULT 0,
                     actor TEXT NOT NULL,
@@ -83,31 +249,228 @@ class SQLiteRepository:
                     ON connections(source_id);
                 CREATE INDEX IF NOT EXISTS idx_connections_target
                     ON connections(target_id);
-                CREATE INDEX IF NOT EXISTS idx_audits_entity
-                    ON audits(entity_type, entity_id);
+                -- Covers the per-entity audit lookups, including the action
+                -- column read by integrity checks. It supersedes the older
+                -- (entity_type, entity_id) index, which is dropped on upgrade.
+                DROP INDEX IF EXISTS idx_audits_entity;
+                CREATE INDEX IF NOT EXISTS idx_audits_entity_action
+                    ON audits(entity_type, entity_id, action);
                 CREATE INDEX IF NOT EXISTS idx_audits_created_at
                     ON audits(created_at DESC);
                 CREATE INDEX IF NOT EXISTS idx_snapshots_saved_at
                     ON graph_snapshots(saved_at DESC);
+
+                -- Partial indexes over live rows: graph reads and cascades
+                -- always filter on is_deleted = 0, so tombstones are skipped
+                -- at the btree level.
+                CREATE INDEX IF NOT EXISTS idx_connections_source_live
+                    ON connections(source_id, target_id) WHERE is_deleted = 0;
+                CREATE INDEX IF NOT EXISTS idx_connections_target_live
+                    ON connections(target_id, source_id) WHERE is_deleted = 0;
+                CREATE INDEX IF NOT EXISTS idx_connections_created_live
+                    ON connections(created_at) WHERE is_deleted = 0;
+                CREATE INDEX IF NOT EXISTS idx_nodes_created_live
+                    ON nodes(created_at) WHERE is_deleted = 0;
+
+                PRAGMA analysis_limit = 400;
+                ANALYZE;
+
+                PRAGMA user_version = {SCHEMA_VERSION};
+                COMMIT;
                 """
             )
 
     @contextmanager
-    def transaction(self) -> Iterator[sqlite3.Connection]:
-        conn = self._connect()
-        try:
-            yield conn
-            conn.commit()
-        except Exception:
-            conn.rollback()
-            raise
-        finally:
-            conn.close()
+    def transaction(self, *, immediate: bool = False) -> Iterator[sqlite3.Connection]:
+        """Run a write transaction on the writer connection.
+
+        ``immediate=True`` takes SQLite's write lock up front with
+        ``BEGIN IMMEDIATE`` instead of upgrading from a read lock on the
+        first write.
+        """
+        with self._writer_lock:
+            conn = self._writer_connection()
+            try:
+                if immediate:
+                    conn.execute("BEGIN IMMEDIATE")
+                yield conn
+                conn.commit()
+            except BaseException:
+                # The writer outlives the transaction, so an interrupt must
+                # not leave it mid-transaction for the next caller to commit.
+                conn.rollback()
+                raise
+            finally:
+                self._invalidate_query_cache()
+
+    def bulk_insert(
+        self,
+        table: str,
+        columns: Sequence[str],
+        rows: Iterable[Sequence[object]],
+        *,
+        conn: sqlite3.Connection | None = None,
+    ) -> int:
+        """Insert many rows with ``executemany`` and return the inserted count.
+
+        ``table`` and ``columns`` are interpolated into SQL and must be
+        trusted identifiers. Pass ``conn`` to join an open transaction;
+        otherwise a dedicated ``BEGIN IMMEDIATE`` transaction is used.
+        """
+        if conn is None:
+            with self.transaction(immediate=True) as tx_conn:
+                return self.bulk_insert(table, columns, rows, conn=tx_conn)
+
+        query = (
+            f"INSERT INTO {table} ({', '.join(columns)}) "
+            f"VALUES ({', '.join('?' * len(columns))})"
+        )
+        inserted = 0
+        iterator = iter(rows)
+        while True:
+            chunk = list(islice(iterator, BULK_INSERT_CHUNK_SIZE))
+            if not chunk:
+                return inserted
+            conn.executemany(query, chunk)
+            inserted += len(chunk)
+
+    def _invalidate_query_cache(self) -> None:
+        with self._query_cache_lock:
+            self._query_cache_generation += 1
+            self._query_cache.clear()
+
+    def _drop_stale_cache(self, conn: sqlite3.Connection) -> None:
+        # `conn` is a leased reader. Its data_version changes whenever another
+        # connection commits, which covers this repository's writer as well
+        # as other processes. A reader seen for the first time cannot tell
+        # what it missed, so it invalidates too (once per pooled reader).
+        data_version = int(conn.execute("PRAGMA data_version").fetchone()[0])
+        if self._seen_data_versions.get(id(conn)) != data_version:
+            self._seen_data_versions[id(conn)] = data_version
+            self._invalidate_query_cache()
+
+    def _cached_read(
+        self,
+        kind: str,
+        query: str,
+        params: Sequence[object],
+        cache: bool = True,
+    ) -> Any:
+        if self._query_cache_size == 0 or not cache:
+            return self._execute_read(kind, query, params)
+
+        key = (kind, query, tuple(params))
+        with self._lease() as conn:
+            self._drop_stale_cache(conn)
+            # The lock only guards the OrderedDict; queries run outside it.
+            with self._query_cache_lock:
+                if key in self._query_cache:
+                    self._query_cache.move_to_end(key)
+                    return self._query_cache[key]
+                generation = self._query_cache_generation
+
+            result = self._read(conn, kind, query, params)
+
+        with self._query_cache_lock:
+            # Skip storing if a write committed while the query was running.
+            if generation == self._query_cache_generation:
+                self._query_cache[key] = result
+                if len(self._query_cache) > self._query_cache_size:
+                    self._query_cache.popitem(last=False)
+        return result
+
+    def _execute_read(self, kind: str, query: str, params: Sequence[object]) -> Any:
+        with self._lease() as conn:
+            return self._read(conn, kind, query, params)
+
+    @staticmethod
+    def _read(conn: sqlite3.Connection, kind: str, query: str, params: Sequence[object]) -> Any:
+        cursor = conn.execute(query, params)
+        if kind == "one":
+            return cursor.fetchone()
+        return tuple(cursor.fetchall())
+
+    def fetch_one(
+        self,
+        query: str,
+        params: Sequence[object] = (),
+        *,
+        cache: bool = True,
+    ) -> sqlite3.Row | None:
+        """Fetch one row; ``cache=False`` bypasses the read cache for large values."""
+        return self._cached_read("one", query, params, cache)
+
+    def fetch_all(
+        self,
+        query: str,
+        params: Sequence[object] = (),
+        *,
+        cache: bool = True,
+    ) -> list[sqlite3.Row]:
+        """Fetch all rows; ``cache=False`` bypasses the read cache for large results."""
+        return list(self._cached_read("all", query, params, cache))
+
+    def fetch_all_tuples(
+        self,
+        query: str,
+        params: Sequence[object] = (),
+    ) -> list[tuple[Any, ...]]:
+        """Fetch rows as plain tuples, skipping the ``sqlite3.Row`` factory."""
+        with self._lease() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = None
+            return cursor.execute(query, params).fetchall()
+
+    def fetch_all_batch(
+        self,
+        statements: Sequence[tuple[str, Sequence[object]]],
+        *,
+        tuples: bool = False,
+    ) -> list[list[Any]]:
+        """Run several reads on one leased connection and one read snapshot.
+
+        The statements share a single checkout and a deferred read
+        transaction, so related tables (e.g. nodes and their connections)
+        are read consistently and warm the same page cache. ``tuples=True``
+        returns plain tuples instead of ``sqlite3.Row``.
+        """
+        with self._lease() as conn:
+            cursor = conn.cursor()
+            if tuples:
+                cursor.row_factory = None
+            cursor.execute("BEGIN")
+            try:
+                return [cursor.execute(query, params).fetchall() for query, params in statements]
+            finally:
+                cursor.close()
+                conn.rollback()
 
-    def fetch_one(self, query: str, params: Sequence[object] = ()) -> sqlite3.Row | None:
-        with self._connect() as conn:
-            return conn.execute(query, params).fetchone()
+    def iter_rows(
+        self,
+        query: str,
+        params: Sequence[object] = (),
+        batch_size: int = DEFAULT_FETCH_BATCH_SIZE,
+        *,
+        tuples: bool = False,
+    ) -> Iterator[Any]:
+        """Yield rows in ``fetchmany`` batches without materializing the result.
 
-    def fetch_all(self, query: str, params: Sequence[object] = ()) -> list[sqlite3.Row]:
-        with self._connect() as conn:
-            return conn.execute(query, params).fetchall()
+        The reader connection stays leased until the iterator is exhausted or
+        closed; an abandoned iterator is closed on garbage collection, which
+        returns the connection to the pool. ``tuples=True`` yields plain
+        tuples instead of ``sqlite3.Row``.
+        """
+        with self._lease() as conn:
+            cursor = conn.cursor()
+            if tuples:
+                cursor.row_factory = None
+            cursor.execute(query, params)
+            cursor.arraysize = max(int(batch_size), 1)
+            try:
+                while True:
+                    rows = cursor.fetchmany()
+                    if not rows:
+                        return
+                    yield from rows
+            finally:
+                cursor.close()
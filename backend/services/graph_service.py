@@ -2,11 +2,18 @@
 
 from __future__ import annotations
 
-from typing import TypeVar, cast
+from collections import Counter
+from dataclasses import replace
+from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
+from typing import Any, Iterable, Iterator, Sequence, TypeVar, cast
 import json
+import os
 import sqlite3
 import uuid
 
+from backend.json_codec import dumps_compact, loads_json
 from backend.repository import SQLiteRepository
 from core.visualization import build_vis_payload
 from datamodels.graph_models import (
@@ -34,6 +41,7 @@ from datamodels.graph_models import (
     GraphSavePayload,
     GraphSaveResult,
     GraphSnapshot,
+    JsonObject,
     Node,
     NodeCreatePayload,
     NodeUpdatePayload,
@@ -45,12 +53,200 @@ from datamodels.graph_models import (
 
 T = TypeVar("T")
 
+_CONNECTION_TYPE_VALUES: frozenset[str] = frozenset(ConnectionType.values())
+
+NODE_COLUMNS: tuple[str, ...] = (
+    "id",
+    "content",
+    "summary",
+    "position_x",
+    "position_y",
+    "color",
+    "size",
+    "tags",
+    "confidence",
+    "evidence",
+    "created_at",
+    "updated_at",
+    "version",
+    "is_deleted",
+)
+CONNECTION_COLUMNS: tuple[str, ...] = (
+    "id",
+    "source_id",
+    "target_id",
+    "conn_type",
+    "description",
+    "strength",
+    "created_at",
+    "updated_at",
+    "version",
+    "is_deleted",
+)
+
+MAX_AUDIT_LIST_LIMIT = 1000
+MAX_AUDIT_EXPORT_LIMIT = 5000
+MAX_SNAPSHOT_NAME_LENGTH = 120
+
+# SQL text is kept in module constants so every call reuses the exact same
+# string and hits the connection's prepared-statement cache.
+_SQL_INSERT_NODE = (
+    f"INSERT INTO nodes ({', '.join(NODE_COLUMNS)}) "
+    f"VALUES ({', '.join('?' * len(NODE_COLUMNS))})"
+)
+_SQL_INSERT_CONNECTION = (
+    f"INSERT INTO connections ({', '.join(CONNECTION_COLUMNS)}) "
+    f"VALUES ({', '.join('?' * len(CONNECTION_COLUMNS))})"
+)
+_SQL_INSERT_CONNECTION_IF_ENDPOINTS_LIVE = (
+    f"INSERT INTO connections ({', '.join(CONNECTION_COLUMNS)}) "
+    f"SELECT {', '.join('?' * len(CONNECTION_COLUMNS))} "
+    "WHERE (SELECT COUNT(*) FROM nodes WHERE id IN (?, ?) AND is_deleted = 0) = 2"
+)
+_SQL_SELECT_NODES = f"SELECT {', '.join(NODE_COLUMNS)} FROM nodes"
+_SQL_SELECT_CONNECTIONS = f"SELECT {', '.join(CONNECTION_COLUMNS)} FROM connections"
+_SQL_SELECT_AUDITS = (
+    "SELECT id, entity_type, entity_id, action, actor, reason, "
+    "before_state, after_state, created_at FROM audits"
+)
+_SQL_SELECT_NODE = f"{_SQL_SELECT_NODES} WHERE id = ?"
+_SQL_SELECT_LIVE_NODE = f"{_SQL_SELECT_NODES} WHERE id = ? AND is_deleted = 0"
+_SQL_SELECT_CONNECTION = f"{_SQL_SELECT_CONNECTIONS} WHERE id = ?"
+_SQL_SELECT_LIVE_NODES = f"{_SQL_SELECT_NODES} WHERE is_deleted = 0"
+_SQL_SELECT_LIVE_CONNECTIONS = f"{_SQL_SELECT_CONNECTIONS} WHERE is_deleted = 0"
+_SQL_SELECT_LIVE_NODES_ORDERED = f"{_SQL_SELECT_LIVE_NODES} ORDER BY created_at ASC"
+_SQL_SELECT_LIVE_CONNECTIONS_ORDERED = f"{_SQL_SELECT_LIVE_CONNECTIONS} ORDER BY created_at ASC"
+_SQL_SELECT_NODE_EDGES = (
+    f"{_SQL_SELECT_LIVE_CONNECTIONS} AND (source_id = ? OR target_id = ?)"
+)
+_SQL_UPDATE_CONNECTION = """
+    UPDATE connections
+    SET
+        conn_type = ?,
+        description = ?,
+        strength = ?,
+        updated_at = ?,
+        version = ?
+    WHERE id = ?
+"""
+_SQL_SOFT_DELETE_NODE = """
+    UPDATE nodes
+    SET is_deleted = 1, version = ?, updated_at = ?
+    WHERE id = ?
+"""
+_SQL_SOFT_DELETE_CONNECTION = """
+    UPDATE connections
+    SET is_deleted = 1, version = ?, updated_at = ?
+    WHERE id = ?
+"""
+_SQL_SOFT_DELETE_ALL_NODES = """
+    UPDATE nodes
+    SET is_deleted = 1, version = version + 1, updated_at = ?
+    WHERE is_deleted = 0
+"""
+_SQL_SOFT_DELETE_ALL_CONNECTIONS = """
+    UPDATE connections
+    SET is_deleted = 1, version = version + 1, updated_at = ?
+    WHERE is_deleted = 0
+"""
+_SQL_CASCADE_DELETE_NODE_EDGES = """
+    UPDATE connections
+    SET is_deleted = 1, version = version + 1, updated_at = ?
+    WHERE is_deleted = 0 AND (source_id = ? OR target_id = ?)
+"""
+_SQL_UPSERT_SNAPSHOT = """
+    INSERT INTO graph_snapshots (
+        name, payload, node_count, connection_count, actor, saved_at
+    ) VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT(name) DO UPDATE SET
+        payload = excluded.payload,
+        node_count = excluded.node_count,
+        connection_count = excluded.connection_count,
+        actor = excluded.actor,
+        saved_at = excluded.saved_at
+"""
+_SQL_SELECT_SNAPSHOT_SUMMARIES = """
+    SELECT name, node_count, connection_count, actor, saved_at
+    FROM graph_snapshots
+    ORDER BY saved_at DESC
+"""
+_SQL_SELECT_SNAPSHOT_PAYLOAD = "SELECT payload FROM graph_snapshots WHERE name = ?"
+_SQL_DELETE_SNAPSHOT = "DELETE FROM graph_snapshots WHERE name = ?"
+_SQL_INSERT_AUDIT = """
+    INSERT INTO audits (
+        entity_type, entity_id, action,
+        actor, reason,
+        before_state, after_state,
+        created_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Audit listings filter on any combination of entity type and id; each
+# variant's SQL is built once so repeated calls hit the statement cache.
+_AUDIT_FILTER_WHERE: dict[tuple[bool, bool], str] = {
+    (False, False): "",
+    (True, False): " WHERE entity_type = ?",
+    (False, True): " WHERE entity_id = ?",
+    (True, True): " WHERE entity_type = ? AND entity_id = ?",
+}
+_SQL_LIST_AUDITS: dict[tuple[bool, bool], str] = {
+    variant: f"{_SQL_SELECT_AUDITS}{where} ORDER BY id DESC LIMIT ?"
+    for variant, where in _AUDIT_FILTER_WHERE.items()
+}
+_SQL_AUDIT_TRAIL_TEMPLATE = """
+    SELECT t.id, t.is_deleted, a.action,
+           COALESCE(a.before_state, '') != '' AS has_before,
+           COALESCE(a.after_state, '') != '' AS has_after
+    FROM {table} AS t
+    LEFT JOIN audits AS a ON a.entity_type = ? AND a.entity_id = t.id
+    ORDER BY t.rowid, a.id
+"""
+_SQL_SELECT_NODE_AUDIT_TRAIL = _SQL_AUDIT_TRAIL_TEMPLATE.format(table="nodes")
+_SQL_SELECT_CONNECTION_AUDIT_TRAIL = _SQL_AUDIT_TRAIL_TEMPLATE.format(table="connections")
+
+
+def _soft_deleted_state(before_state: JsonObject, updated_at: str) -> JsonObject:
+    """Derive a soft-delete after-state from its before-state without re-reading the entity."""
+    return {
+        **before_state,
+        "updated_at": updated_at,
+        "version": cast(int, before_state["version"]) + 1,
+        "is_deleted": True,
+    }
+
+
+def _dumps_str_list(items: list[str]) -> str:
+    # Most nodes carry no tags or evidence; skip the encoder for those.
+    return dumps_compact(items) if items else "[]"
+
+
+def _loads_str_list(raw: str | None) -> list[str]:
+    # Counterpart of _dumps_str_list: empty columns skip the decoder.
+    if not raw or raw == "[]":
+        return []
+    items = _safe_json_loads(raw, [])
+    return [str(item) for item in items] if isinstance(items, list) else []
+
+
+@lru_cache(maxsize=64)
+def _node_update_sql(columns: tuple[str, ...]) -> str:
+    """Build (once per column set) a partial node UPDATE ending in updated_at, version, id."""
+    assignments = "".join(f"{column} = ?, " for column in columns)
+    return f"UPDATE nodes SET {assignments}updated_at = ?, version = ? WHERE id = ?"
+
+
+def _new_ids(count: int) -> Iterator[str]:
+    """Yield ``count`` random (version 4) UUID strings from one urandom read."""
+    raw = os.urandom(16 * count)
+    for offset in range(0, len(raw), 16):
+        yield str(uuid.UUID(bytes=raw[offset : offset + 16], version=4))
+
 
 def _safe_json_loads(raw: str | None, default: T) -> T:
     if not raw:
         return default
     try:
-        return cast(T, json.loads(raw))
+        return cast(T, loads_json(raw))
     except json.JSONDecodeError:
         return default
 
@@ -60,22 +256,36 @@ class GraphService:
         self.repository = repository
 
     def list_nodes(self, include_deleted: bool = False) -> list[Node]:
-        query = "SELECT * FROM nodes"
+        query = _SQL_SELECT_NODES
         if not include_deleted:
             query += " WHERE is_deleted = 0"
         query += " ORDER BY created_at ASC"
-        rows = self.repository.fetch_all(query)
-        return [self._row_to_node(row) for row in rows]
+        return self._rows_to_nodes(self.repository.iter_rows(query, tuples=True))
 
     def get_node(self, node_id: str) -> Node | None:
-        row = self.repository.fetch_one(
-            "SELECT * FROM nodes WHERE id = ? AND is_deleted = 0",
-            (node_id,),
-        )
+        row = self.repository.fetch_one(_SQL_SELECT_LIVE_NODE, (node_id,))
         if not row:
             return None
         return self._row_to_node(row)
 
+    def list_nodes_by_tag(self, tag: str, include_deleted: bool = False) -> list[Node]:
+        # Tags are matched inside SQLite via JSON1 instead of decoding every
+        # row's tag list in Python. Tables created before the json_valid CHECK
+        # can hold malformed tags; the CASE (tried in order, so json_type
+        # never sees bad input) reads those as no tags, like _loads_str_list.
+        query = (
+            f"{_SQL_SELECT_NODES} WHERE EXISTS ("
+            "SELECT 1 FROM json_each("
+            "CASE WHEN NOT json_valid(nodes.tags) THEN '[]' "
+            "WHEN json_type(nodes.tags) = 'array' THEN nodes.tags ELSE '[]' END"
+            ") WHERE json_each.value = ?)"
+        )
+        if not include_deleted:
+            query += " AND is_deleted = 0"
+        query += " ORDER BY created_at ASC"
+        rows = self.repository.fetch_all_tuples(query, (tag,))
+        return self._rows_to_nodes(rows)
+
     def create_node(
         self,
         payload: NodeCreatePayload,
@@ -89,48 +299,18 @@ class GraphService:
         node = Node(
             content=content,
             summary=payload.summary.strip(),
-            position=Position(
-                x=float(payload.position.x),
-                y=float(payload.position.y),
-            ),
+            position=Position(payload.position.x, payload.position.y),
             color=(payload.color.strip() or "#157f83"),
-            size=max(float(payload.size), 0.2),
-            tags=[str(item) for item in payload.tags],
-            confidence=self._clamp(float(payload.confidence), 0.0, 1.0),
-            evidence=[str(item) for item in payload.evidence],
+            size=max(payload.size, 0.2),
+            tags=list(payload.tags),
+            confidence=self._clamp(payload.confidence, 0.0, 1.0),
+            evidence=list(payload.evidence),
         )
 
         audit_reason = reason if reason is not None else payload.reason
 
         with self.repository.transaction() as conn:
-            conn.execute(
-                """
-                INSERT INTO nodes (
-                    id, content, summary,
-                    position_x, position_y,
-                    color, size, tags,
-                    confidence, evidence,
-                    created_at, updated_at,
-                    version, is_deleted
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    node.id,
-                    node.content,
-                    node.summary,
-                    node.position.x,
-                    node.position.y,
-                    node.color,
-                    node.size,
-                    json.dumps(node.tags, ensure_ascii=False),
-                    node.confidence,
-                    json.dumps(node.evidence, ensure_ascii=False),
-                    node.created_at,
-                    node.updated_at,
-                    node.version,
-                    int(node.is_deleted),
-                ),
-            )
+            conn.execute(_SQL_INSERT_NODE, self._node_to_row(node))
             self._insert_audit(
                 conn,
                 AuditLog(
@@ -152,7 +332,7 @@ class GraphService:
         actor: str,
         reason: str | None = None,
     ) -> Node | None:
-        row = self.repository.fetch_one("SELECT * FROM nodes WHERE id = ?", (node_id,))
+        row = self.repository.fetch_one(_SQL_SELECT_NODE, (node_id,))
         if not row:
             return None
 
@@ -161,29 +341,33 @@ class GraphService:
             return None
 
         before_state = current.to_state()
-        updated = Node.from_state(before_state)
+        updated = replace(current)
+        # Only the provided columns are written, so e.g. a drag that moves a
+        # node neither re-encodes its tags/evidence nor rewrites them.
+        changes: dict[str, object] = {}
 
         if payload.has("content"):
             if not payload.content:
                 raise ValueError("`content` cannot be empty.")
-            updated.content = payload.content
+            updated.content = changes["content"] = payload.content
         if payload.has("summary") and payload.summary is not None:
-            updated.summary = payload.summary
+            updated.summary = changes["summary"] = payload.summary
         if payload.has("color") and payload.color is not None:
-            updated.color = payload.color
+            updated.color = changes["color"] = payload.color
         if payload.has("size") and payload.size is not None:
-            updated.size = max(float(payload.size), 0.2)
+            updated.size = changes["size"] = max(payload.size, 0.2)
         if payload.has("confidence") and payload.confidence is not None:
-            updated.confidence = self._clamp(float(payload.confidence), 0.0, 1.0)
+            updated.confidence = changes["confidence"] = self._clamp(payload.confidence, 0.0, 1.0)
         if payload.has("tags") and payload.tags is not None:
-            updated.tags = [str(item) for item in payload.tags]
+            updated.tags = list(payload.tags)
+            changes["tags"] = _dumps_str_list(updated.tags)
         if payload.has("evidence") and payload.evidence is not None:
-            updated.evidence = [str(item) for item in payload.evidence]
+            updated.evidence = list(payload.evidence)
+            changes["evidence"] = _dumps_str_list(updated.evidence)
         if payload.has("position") and payload.position is not None:
-            updated.position = Position(
-                x=float(payload.position.x),
-                y=float(payload.position.y),
-            )
+            updated.position = Position(payload.position.x, payload.position.y)
+            changes["position_x"] = updated.position.x
+            changes["position_y"] = updated.position.y
 
         updated.version = current.version + 1
         updated.updated_at = utc_now()
@@ -193,36 +377,8 @@ class GraphService:
 
         with self.repository.transaction() as conn:
             conn.execute(
-                """
-                UPDATE nodes
-                SET
-                    content = ?,
-                    summary = ?,
-                    position_x = ?,
-                    position_y = ?,
-                    color = ?,
-                    size = ?,
-                    tags = ?,
-                    confidence = ?,
-                    evidence = ?,
-                    updated_at = ?,
-                    version = ?
-                WHERE id = ?
-                """,
-                (
-                    updated.content,
-                    updated.summary,
-                    updated.position.x,
-                    updated.position.y,
-                    updated.color,
-                    updated.size,
-                    json.dumps(updated.tags, ensure_ascii=False),
-                    updated.confidence,
-                    json.dumps(updated.evidence, ensure_ascii=False),
-                    updated.updated_at,
-                    updated.version,
-                    node_id,
-                ),
+                _node_update_sql(tuple(changes)),
+                (*changes.values(), updated.updated_at, updated.version, node_id),
             )
             self._insert_audit(
                 conn,
@@ -246,7 +402,7 @@ class GraphService:
         payload: DeletePayload | None = None,
         reason: str | None = None,
     ) -> bool:
-        row = self.repository.fetch_one("SELECT * FROM nodes WHERE id = ?", (node_id,))
+        row = self.repository.fetch_one(_SQL_SELECT_NODE, (node_id,))
         if not row:
             return False
 
@@ -265,11 +421,7 @@ class GraphService:
 
         with self.repository.transaction() as conn:
             conn.execute(
-                """
-                UPDATE nodes
-                SET is_deleted = 1, version = ?, updated_at = ?
-                WHERE id = ?
-                """,
+                _SQL_SOFT_DELETE_NODE,
                 (node.version, node.updated_at, node_id),
             )
             self._insert_audit(
@@ -285,51 +437,43 @@ class GraphService:
                 ),
             )
 
+            # Audit rows need each edge's full before-state, but the soft
+            # delete itself is one set-based UPDATE over the same edges.
             connected_rows = conn.execute(
-                """
-                SELECT * FROM connections
-                WHERE is_deleted = 0 AND (source_id = ? OR target_id = ?)
-                """,
+                _SQL_SELECT_NODE_EDGES,
                 (node_id, node_id),
             ).fetchall()
-            for edge_row in connected_rows:
-                edge = self._row_to_connection(edge_row)
-                edge_before = edge.to_state()
-                edge.is_deleted = True
-                edge.version += 1
-                edge.updated_at = utc_now()
-
+            if connected_rows:
                 conn.execute(
-                    """
-                    UPDATE connections
-                    SET is_deleted = 1, version = ?, updated_at = ?
-                    WHERE id = ?
-                    """,
-                    (edge.version, edge.updated_at, edge.id),
+                    _SQL_CASCADE_DELETE_NODE_EDGES,
+                    (node.updated_at, node_id, node_id),
                 )
-                cascade_reason = (audit_reason or "") + " [cascade by node deletion]"
-                self._insert_audit(
-                    conn,
+
+            cascade_reason = (audit_reason or "") + " [cascade by node deletion]"
+            cascade_logs: list[AuditLog] = []
+            for edge_row in connected_rows:
+                edge_before = self._row_to_connection_state(edge_row)
+                cascade_logs.append(
                     AuditLog(
                         entity_type=EntityType.CONNECTION.value,
-                        entity_id=edge.id,
+                        entity_id=str(edge_before["id"]),
                         action=AuditAction.DELETE.value,
                         actor=actor,
                         reason=cascade_reason,
                         before_state=edge_before,
-                        after_state=edge.to_state(),
-                    ),
+                        after_state=_soft_deleted_state(edge_before, node.updated_at),
+                    )
                 )
+            self._insert_audit_many(conn, cascade_logs)
 
         return True
 
     def list_connections(self, include_deleted: bool = False) -> list[Connection]:
-        query = "SELECT * FROM connections"
+        query = _SQL_SELECT_CONNECTIONS
         if not include_deleted:
             query += " WHERE is_deleted = 0"
         query += " ORDER BY created_at ASC"
-        rows = self.repository.fetch_all(query)
-        return [self._row_to_connection(row) for row in rows]
+        return self._rows_to_connections(self.repository.iter_rows(query, tuples=True))
 
     def create_connection(
         self,
@@ -345,20 +489,9 @@ class GraphService:
             raise ValueError("Self-loop is not allowed for connection.")
 
         conn_type_raw = payload.conn_type
-        if conn_type_raw not in ConnectionType.values():
+        if conn_type_raw not in _CONNECTION_TYPE_VALUES:
             raise ValueError("Invalid `conn_type`.")
 
-        source = self.repository.fetch_one(
-            "SELECT id FROM nodes WHERE id = ? AND is_deleted = 0",
-            (source_id,),
-        )
-        target = self.repository.fetch_one(
-            "SELECT id FROM nodes WHERE id = ? AND is_deleted = 0",
-            (target_id,),
-        )
-        if not source or not target:
-            raise ValueError("Source/target node does not exist or is deleted.")
-
         edge = Connection(
             source_id=source_id,
             target_id=target_id,
@@ -370,28 +503,14 @@ class GraphService:
         audit_reason = reason if reason is not None else payload.reason
 
         with self.repository.transaction() as conn:
-            conn.execute(
-                """
-                INSERT INTO connections (
-                    id, source_id, target_id,
-                    conn_type, description, strength,
-                    created_at, updated_at,
-                    version, is_deleted
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    edge.id,
-                    edge.source_id,
-                    edge.target_id,
-                    edge.conn_type,
-                    edge.description,
-                    edge.strength,
-                    edge.created_at,
-                    edge.updated_at,
-                    edge.version,
-                    int(edge.is_deleted),
-                ),
+            # The endpoint check rides on the INSERT itself, so it costs no
+            # extra round-trip and cannot race a concurrent node delete.
+            cursor = conn.execute(
+                _SQL_INSERT_CONNECTION_IF_ENDPOINTS_LIVE,
+                (*self._connection_to_row(edge), source_id, target_id),
             )
+            if cursor.rowcount == 0:
+                raise ValueError("Source/target node does not exist or is deleted.")
             self._insert_audit(
                 conn,
                 AuditLog(
@@ -413,7 +532,7 @@ class GraphService:
         actor: str,
         reason: str | None = None,
     ) -> Connection | None:
-        row = self.repository.fetch_one("SELECT * FROM connections WHERE id = ?", (conn_id,))
+        row = self.repository.fetch_one(_SQL_SELECT_CONNECTION, (conn_id,))
         if not row:
             return None
 
@@ -429,7 +548,7 @@ class GraphService:
         if payload.has("strength") and payload.strength is not None:
             updated.strength = max(float(payload.strength), 0.1)
         if payload.has("conn_type") and payload.conn_type is not None:
-            if payload.conn_type not in ConnectionType.values():
+            if payload.conn_type not in _CONNECTION_TYPE_VALUES:
                 raise ValueError("Invalid `conn_type`.")
             updated.conn_type = payload.conn_type
 
@@ -441,16 +560,7 @@ class GraphService:
 
         with self.repository.transaction() as conn:
             conn.execute(
-                """
-                UPDATE connections
-                SET
-                    conn_type = ?,
-                    description = ?,
-                    strength = ?,
-                    updated_at = ?,
-                    version = ?
-                WHERE id = ?
-                """,
+                _SQL_UPDATE_CONNECTION,
                 (
                     updated.conn_type,
                     updated.description,
@@ -482,7 +592,7 @@ class GraphService:
         payload: DeletePayload | None = None,
         reason: str | None = None,
     ) -> bool:
-        row = self.repository.fetch_one("SELECT * FROM connections WHERE id = ?", (conn_id,))
+        row = self.repository.fetch_one(_SQL_SELECT_CONNECTION, (conn_id,))
         if not row:
             return False
 
@@ -500,11 +610,7 @@ class GraphService:
 
         with self.repository.transaction() as conn:
             conn.execute(
-                """
-                UPDATE connections
-                SET is_deleted = 1, version = ?, updated_at = ?
-                WHERE id = ?
-                """,
+                _SQL_SOFT_DELETE_CONNECTION,
                 (edge.version, edge.updated_at, conn_id),
             )
             self._insert_audit(
@@ -523,15 +629,7 @@ class GraphService:
         return True
 
     def graph_snapshot(self) -> GraphSnapshot:
-        node_rows = self.repository.fetch_all(
-            "SELECT * FROM nodes WHERE is_deleted = 0 ORDER BY created_at ASC"
-        )
-        conn_rows = self.repository.fetch_all(
-            "SELECT * FROM connections WHERE is_deleted = 0 ORDER BY created_at ASC"
-        )
-
-        nodes = [self._row_to_node(row) for row in node_rows]
-        connections = [self._row_to_connection(row) for row in conn_rows]
+        nodes, connections = self._read_live_graph()
         vis_payload = build_vis_payload(nodes, connections)
 
         return GraphSnapshot(
@@ -540,10 +638,22 @@ class GraphService:
             visualization=vis_payload,
         )
 
+    def _read_live_graph(self) -> tuple[list[Node], list[Connection]]:
+        node_rows, connection_rows = self.repository.fetch_all_batch(
+            (
+                (_SQL_SELECT_LIVE_NODES_ORDERED, ()),
+                (_SQL_SELECT_LIVE_CONNECTIONS_ORDERED, ()),
+            ),
+            tuples=True,
+        )
+        return self._rows_to_nodes(node_rows), self._rows_to_connections(connection_rows)
+
     def export_graph(self) -> GraphExportResult:
-        snapshot = self.graph_snapshot()
-        node_states = [node.to_state() for node in snapshot.nodes]
-        connection_states = [conn.to_state() for conn in snapshot.connections]
+        # Exports carry plain states only, so the visualization payload that
+        # graph_snapshot builds is skipped.
+        nodes, connections = self._read_live_graph()
+        node_states = [node.to_state() for node in nodes]
+        connection_states = [conn.to_state() for conn in connections]
         exported_at = utc_now()
         safe_stamp = (
             exported_at.replace(":", "-")
@@ -570,33 +680,33 @@ class GraphService:
     ) -> GraphSaveResult:
         name = self._normalize_snapshot_name(payload.name)
         saved_at = utc_now()
-        snapshot = self.graph_snapshot()
-        node_states = [node.to_state() for node in snapshot.nodes]
-        connection_states = [conn.to_state() for conn in snapshot.connections]
-        snapshot_payload = {
-            "name": name,
-            "saved_at": saved_at,
-            "reason": reason if reason is not None else payload.reason,
-            "nodes": node_states,
-            "connections": connection_states,
-        }
+        snapshot_reason = reason if reason is not None else payload.reason
 
+        # The live graph is read on the writer connection, so the payload is
+        # consistent with the upsert that stores it.
         with self.repository.transaction() as conn:
+            node_states = [
+                node.to_state()
+                for node in self._rows_to_nodes(conn.execute(_SQL_SELECT_LIVE_NODES_ORDERED))
+            ]
+            connection_states = [
+                edge.to_state()
+                for edge in self._rows_to_connections(
+                    conn.execute(_SQL_SELECT_LIVE_CONNECTIONS_ORDERED)
+                )
+            ]
+            snapshot_payload = {
+                "name": name,
+                "saved_at": saved_at,
+                "reason": snapshot_reason,
+                "nodes": node_states,
+                "connections": connection_states,
+            }
             conn.execute(
-                """
-                INSERT INTO graph_snapshots (
-                    name, payload, node_count, connection_count, actor, saved_at
-                ) VALUES (?, ?, ?, ?, ?, ?)
-                ON CONFLICT(name) DO UPDATE SET
-                    payload = excluded.payload,
-                    node_count = excluded.node_count,
-                    connection_count = excluded.connection_count,
-                    actor = excluded.actor,
-                    saved_at = excluded.saved_at
-                """,
+                _SQL_UPSERT_SNAPSHOT,
                 (
                     name,
-                    json.dumps(snapshot_payload, ensure_ascii=False),
+                    dumps_compact(snapshot_payload),
                     len(node_states),
                     len(connection_states),
                     actor,
@@ -614,22 +724,16 @@ class GraphService:
         )
 
     def list_saved_graphs(self) -> list[SavedGraphSummary]:
-        rows = self.repository.fetch_all(
-            """
-            SELECT name, node_count, connection_count, actor, saved_at
-            FROM graph_snapshots
-            ORDER BY saved_at DESC
-            """
-        )
+        rows = self.repository.fetch_all_tuples(_SQL_SELECT_SNAPSHOT_SUMMARIES)
         return [
             SavedGraphSummary(
-                name=str(row["name"]),
-                node_count=int(row["node_count"]),
-                connection_count=int(row["connection_count"]),
-                actor=str(row["actor"]),
-                saved_at=str(row["saved_at"]),
+                name=str(name),
+                node_count=int(node_count),
+                connection_count=int(connection_count),
+                actor=str(actor),
+                saved_at=str(saved_at),
             )
-            for row in rows
+            for name, node_count, connection_count, actor, saved_at in rows
         ]
 
     def load_graph(
@@ -639,10 +743,8 @@ class GraphService:
         reason: str | None = None,
     ) -> GraphLoadResult:
         name = self._normalize_snapshot_name(payload.name)
-        row = self.repository.fetch_one(
-            "SELECT payload FROM graph_snapshots WHERE name = ?",
-            (name,),
-        )
+        # Snapshot payloads hold a whole graph; keep them out of the read cache.
+        row = self.repository.fetch_one(_SQL_SELECT_SNAPSHOT_PAYLOAD, (name,), cache=False)
         if not row:
             raise ValueError("saved graph not found")
 
@@ -668,7 +770,7 @@ class GraphService:
             else payload.reason if payload.reason is not None
             else f"load graph snapshot: {name}"
         )
-        self._replace_graph_content(
+        restored_nodes, restored_connections = self._replace_graph_content(
             parsed_nodes=parsed_nodes,
             parsed_connections=parsed_connections,
             actor=actor,
@@ -676,12 +778,17 @@ class GraphService:
             create_reason=f"{audit_reason} [restore snapshot]",
         )
 
-        loaded_snapshot = self.graph_snapshot()
+        # The restored graph is exactly what was just written, so the result
+        # is built from memory instead of re-reading both tables.
         return GraphLoadResult(
             name=name,
             loaded_at=utc_now(),
             message="graph snapshot loaded",
-            snapshot=loaded_snapshot,
+            snapshot=GraphSnapshot(
+                nodes=restored_nodes,
+                connections=restored_connections,
+                visualization=build_vis_payload(restored_nodes, restored_connections),
+            ),
         )
 
     def import_graph(
@@ -712,8 +819,8 @@ class GraphService:
         )
 
         return GraphImportResult(
-            node_count=restored_nodes,
-            connection_count=restored_connections,
+            node_count=len(restored_nodes),
+            connection_count=len(restored_connections),
             imported_at=utc_now(),
             message="graph imported",
         )
@@ -726,111 +833,40 @@ class GraphService:
         actor: str,
         clear_reason: str,
         create_reason: str,
-    ) -> tuple[int, int]:
+    ) -> tuple[list[Node], list[Connection]]:
         now = utc_now()
-        restored_node_count = 0
-        restored_connection_count = 0
-
-        with self.repository.transaction() as conn:
-            active_connections = conn.execute(
-                "SELECT * FROM connections WHERE is_deleted = 0"
-            ).fetchall()
-            for row_item in active_connections:
-                existing = self._row_to_connection(row_item)
-                before_state = existing.to_state()
-                existing.is_deleted = True
-                existing.version += 1
-                existing.updated_at = now
-                conn.execute(
-                    """
-                    UPDATE connections
-                    SET is_deleted = 1, version = ?, updated_at = ?
-                    WHERE id = ?
-                    """,
-                    (existing.version, existing.updated_at, existing.id),
-                )
-                self._insert_audit(
-                    conn,
-                    AuditLog(
-                        entity_type=EntityType.CONNECTION.value,
-                        entity_id=existing.id,
-                        action=AuditAction.DELETE.value,
-                        actor=actor,
-                        reason=clear_reason,
-                        before_state=before_state,
-                        after_state=existing.to_state(),
-                    ),
-                )
-
-            active_nodes = conn.execute("SELECT * FROM nodes WHERE is_deleted = 0").fetchall()
-            for row_item in active_nodes:
-                existing = self._row_to_node(row_item)
-                before_state = existing.to_state()
-                existing.is_deleted = True
-                existing.version += 1
-                existing.updated_at = now
-                conn.execute(
-                    """
-                    UPDATE nodes
-                    SET is_deleted = 1, version = ?, updated_at = ?
-                    WHERE id = ?
-                    """,
-                    (existing.version, existing.updated_at, existing.id),
-                )
-                self._insert_audit(
-                    conn,
-                    AuditLog(
-                        entity_type=EntityType.NODE.value,
-                        entity_id=existing.id,
-                        action=AuditAction.DELETE.value,
-                        actor=actor,
-                        reason=clear_reason,
-                        before_state=before_state,
-                        after_state=existing.to_state(),
-                    ),
-                )
-
+        audit_logs: list[AuditLog] = []
+
+        with self.repository.transaction(immediate=True) as conn:
+            # The clear phase audits each live row, then soft-deletes each
+            # table in one UPDATE.
+            # Rows are tombstoned rather than moved or DELETEd: include_deleted
+            # listings, audit integrity checks and the connections -> nodes
+            # foreign keys all still reference them, and the live partial
+            # indexes already keep tombstones out of every hot read path.
+            self._soft_delete_live_graph(conn, actor=actor, reason=clear_reason, now=now)
+
+            new_ids = _new_ids(len(parsed_nodes) + len(parsed_connections))
             node_id_map: dict[str, str] = {}
+            restored_nodes: list[Node] = []
             for source_node in parsed_nodes:
-                restored = Node.from_state(source_node.to_state())
-                original_id = restored.id
-                restored.id = str(uuid.uuid4())
-                restored.created_at = now
-                restored.updated_at = now
-                restored.version = 1
-                restored.is_deleted = False
-                node_id_map[original_id] = restored.id
-
-                conn.execute(
-                    """
-                    INSERT INTO nodes (
-                        id, content, summary,
-                        position_x, position_y,
-                        color, size, tags,
-                        confidence, evidence,
-                        created_at, updated_at,
-                        version, is_deleted
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        restored.id,
-                        restored.content,
-                        restored.summary,
-                        restored.position.x,
-                        restored.position.y,
-                        restored.color,
-                        restored.size,
-                        json.dumps(restored.tags, ensure_ascii=False),
-                        restored.confidence,
-                        json.dumps(restored.evidence, ensure_ascii=False),
-                        restored.created_at,
-                        restored.updated_at,
-                        restored.version,
-                        int(restored.is_deleted),
-                    ),
+                # Parsed nodes were already validated by from_state; copy the
+                # mutable parts and stamp a fresh identity.
+                restored = replace(
+                    source_node,
+                    id=next(new_ids),
+                    position=Position(source_node.position.x, source_node.position.y),
+                    tags=list(source_node.tags),
+                    evidence=list(source_node.evidence),
+                    created_at=now,
+                    updated_at=now,
+                    version=1,
+                    is_deleted=False,
                 )
-                self._insert_audit(
-                    conn,
+                node_id_map[source_node.id] = restored.id
+
+                restored_nodes.append(restored)
+                audit_logs.append(
                     AuditLog(
                         entity_type=EntityType.NODE.value,
                         entity_id=restored.id,
@@ -838,49 +874,37 @@ class GraphService:
                         actor=actor,
                         reason=create_reason,
                         after_state=restored.to_state(),
-                    ),
+                    )
                 )
-                restored_node_count += 1
+            self.repository.bulk_insert(
+                "nodes",
+                NODE_COLUMNS,
+                map(self._node_to_row, restored_nodes),
+                conn=conn,
+            )
 
+            restored_connections: list[Connection] = []
             for source_conn in parsed_connections:
                 if source_conn.source_id not in node_id_map or source_conn.target_id not in node_id_map:
                     continue
 
-                restored = Connection.from_state(source_conn.to_state())
-                restored.id = str(uuid.uuid4())
-                restored.source_id = node_id_map[source_conn.source_id]
-                restored.target_id = node_id_map[source_conn.target_id]
-                if restored.source_id == restored.target_id:
+                source_id = node_id_map[source_conn.source_id]
+                target_id = node_id_map[source_conn.target_id]
+                if source_id == target_id:
                     continue
-                restored.created_at = now
-                restored.updated_at = now
-                restored.version = 1
-                restored.is_deleted = False
-
-                conn.execute(
-                    """
-                    INSERT INTO connections (
-                        id, source_id, target_id,
-                        conn_type, description, strength,
-                        created_at, updated_at,
-                        version, is_deleted
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        restored.id,
-                        restored.source_id,
-                        restored.target_id,
-                        restored.conn_type,
-                        restored.description,
-                        restored.strength,
-                        restored.created_at,
-                        restored.updated_at,
-                        restored.version,
-                        int(restored.is_deleted),
-                    ),
+                restored = replace(
+                    source_conn,
+                    id=next(new_ids),
+                    source_id=source_id,
+                    target_id=target_id,
+                    created_at=now,
+                    updated_at=now,
+                    version=1,
+                    is_deleted=False,
                 )
-                self._insert_audit(
-                    conn,
+
+                restored_connections.append(restored)
+                audit_logs.append(
                     AuditLog(
                         entity_type=EntityType.CONNECTION.value,
                         entity_id=restored.id,
@@ -888,11 +912,17 @@ class GraphService:
                         actor=actor,
                         reason=create_reason,
                         after_state=restored.to_state(),
-                    ),
+                    )
                 )
-                restored_connection_count += 1
+            self.repository.bulk_insert(
+                "connections",
+                CONNECTION_COLUMNS,
+                map(self._connection_to_row, restored_connections),
+                conn=conn,
+            )
+            self._insert_audit_many(conn, audit_logs)
 
-        return restored_node_count, restored_connection_count
+        return restored_nodes, restored_connections
 
     def delete_saved_graph(
         self,
@@ -904,10 +934,7 @@ class GraphService:
         deleted_at = utc_now()
 
         with self.repository.transaction() as conn:
-            cursor = conn.execute(
-                "DELETE FROM graph_snapshots WHERE name = ?",
-                (name,),
-            )
+            cursor = conn.execute(_SQL_DELETE_SNAPSHOT, (name,))
             if int(cursor.rowcount) <= 0:
                 raise ValueError("saved graph not found")
 
@@ -933,71 +960,10 @@ class GraphService:
         clear_reason = f"{audit_reason} [clear existing graph]"
         now = utc_now()
 
-        cleared_connections = 0
-        cleared_nodes = 0
-
         with self.repository.transaction() as conn:
-            active_connections = conn.execute(
-                "SELECT * FROM connections WHERE is_deleted = 0"
-            ).fetchall()
-            for row_item in active_connections:
-                existing = self._row_to_connection(row_item)
-                before_state = existing.to_state()
-                existing.is_deleted = True
-                existing.version += 1
-                existing.updated_at = now
-
-                conn.execute(
-                    """
-                    UPDATE connections
-                    SET is_deleted = 1, version = ?, updated_at = ?
-                    WHERE id = ?
-                    """,
-                    (existing.version, existing.updated_at, existing.id),
-                )
-                self._insert_audit(
-                    conn,
-                    AuditLog(
-                        entity_type=EntityType.CONNECTION.value,
-                        entity_id=existing.id,
-                        action=AuditAction.DELETE.value,
-                        actor=actor,
-                        reason=clear_reason,
-                        before_state=before_state,
-                        after_state=existing.to_state(),
-                    ),
-                )
-                cleared_connections += 1
-
-            active_nodes = conn.execute("SELECT * FROM nodes WHERE is_deleted = 0").fetchall()
-            for row_item in active_nodes:
-                existing = self._row_to_node(row_item)
-                before_state = existing.to_state()
-                existing.is_deleted = True
-                existing.version += 1
-                existing.updated_at = now
-
-                conn.execute(
-                    """
-                    UPDATE nodes
-                    SET is_deleted = 1, version = ?, updated_at = ?
-                    WHERE id = ?
-                    """,
-                    (existing.version, existing.updated_at, existing.id),
-                )
-                self._insert_audit(
-                    conn,
-                    AuditLog(
-                        entity_type=EntityType.NODE.value,
-                        entity_id=existing.id,
-                        action=AuditAction.DELETE.value,
-                        actor=actor,
-                        reason=clear_reason,
-                        before_state=before_state,
-                        after_state=existing.to_state(),
-                    ),
-                )
-                cleared_nodes += 1
+            cleared_nodes, cleared_connections = self._soft_delete_live_graph(
+                conn, actor=actor, reason=clear_reason, now=now
+            )
 
         return GraphClearResult(
             cleared_nodes=cleared_nodes,
@@ -1007,20 +973,12 @@ class GraphService:
         )
 
     def list_audits(self, query: AuditQuery) -> list[AuditRecord]:
-        sql = "SELECT * FROM audits WHERE 1 = 1"
-        params: list[object] = []
-
-        if query.entity_type:
-            sql += " AND entity_type = ?"
-            params.append(query.entity_type)
-        if query.entity_id:
-            sql += " AND entity_id = ?"
-            params.append(query.entity_id)
-
-        sql += " ORDER BY id DESC LIMIT ?"
-        params.append(min(max(int(query.limit), 1), 1000))
+        variant, params = self._audit_filter(query)
+        sql = _SQL_LIST_AUDITS[variant]
+        params.append(min(max(int(query.limit), 1), MAX_AUDIT_LIST_LIMIT))
 
-        rows = self.repository.fetch_all(sql, params)
+        # Audit pages can be large and are rarely re-read unchanged.
+        rows = self.repository.fetch_all(sql, params, cache=False)
         return [
             AuditRecord(
                 id=int(row["id"]),
@@ -1040,18 +998,10 @@ class GraphService:
         normalized_query = AuditQuery(
             entity_type=(query.entity_type or None),
             entity_id=(query.entity_id or None),
-            limit=min(max(int(query.limit), 1), 5000),
+            limit=min(max(int(query.limit), 1), MAX_AUDIT_EXPORT_LIMIT),
         )
         audits = self.list_audits(normalized_query)
-
-        entity_counts: dict[str, int] = {}
-        action_counts: dict[str, int] = {}
-        actor_counts: dict[str, int] = {}
-
-        for record in audits:
-            entity_counts[record.entity_type] = entity_counts.get(record.entity_type, 0) + 1
-            action_counts[record.action] = action_counts.get(record.action, 0) + 1
-            actor_counts[record.actor] = actor_counts.get(record.actor, 0) + 1
+        entity_counts, action_counts, actor_counts = self._audit_counts(audits)
 
         exported_at = utc_now()
         safe_stamp = (
@@ -1072,45 +1022,70 @@ class GraphService:
             audits=audits,
         )
 
+    @staticmethod
+    def _audit_filter(query: AuditQuery) -> tuple[tuple[bool, bool], list[object]]:
+        """Return the precompiled filter variant key and its bind parameters."""
+        params: list[object] = []
+        if query.entity_type:
+            params.append(query.entity_type)
+        if query.entity_id:
+            params.append(query.entity_id)
+        return (bool(query.entity_type), bool(query.entity_id)), params
+
+    @staticmethod
+    def _audit_counts(
+        audits: Sequence[AuditRecord],
+    ) -> tuple[dict[str, int], dict[str, int], dict[str, int]]:
+        """Count the exported audits per entity type, action and actor.
+
+        Counting the records already fetched keeps the totals consistent with
+        them; Counter keeps first-seen order (newest audit first).
+        """
+        return (
+            dict(Counter(record.entity_type for record in audits)),
+            dict(Counter(record.action for record in audits)),
+            dict(Counter(record.actor for record in audits)),
+        )
+
     def verify_audit_integrity(self) -> AuditIntegrityReport:
         issues: list[str] = []
 
-        entity_table_pairs = (
-            (EntityType.NODE.value, "nodes"),
-            (EntityType.CONNECTION.value, "connections"),
+        # One LEFT JOIN per entity table streams every entity with its audits
+        # in order; rows are grouped back per entity as they arrive. The
+        # state columns are reduced to presence flags in SQL so snapshot
+        # blobs never leave the database.
+        entity_queries = (
+            (EntityType.NODE.value, _SQL_SELECT_NODE_AUDIT_TRAIL),
+            (EntityType.CONNECTION.value, _SQL_SELECT_CONNECTION_AUDIT_TRAIL),
         )
 
-        for entity_type, table in entity_table_pairs:
-            records = self.repository.fetch_all(f"SELECT id, is_deleted FROM {table}")
-            for record in records:
-                entity_id = str(record["id"])
-                actions = self.repository.fetch_all(
-                    """
-                    SELECT action, before_state, after_state
-                    FROM audits
-                    WHERE entity_type = ? AND entity_id = ?
-                    """,
-                    (entity_type, entity_id),
-                )
-                action_names = {str(row["action"]) for row in actions}
+        for entity_type, query in entity_queries:
+            trail = self.repository.iter_rows(query, (entity_type,), tuples=True)
+            for (raw_id, is_deleted), rows in groupby(trail, key=itemgetter(0, 1)):
+                entity_id = str(raw_id)
+                actions = [
+                    (str(action), has_before, has_after)
+                    for _, _, action, has_before, has_after in rows
+                    if action is not None
+                ]
+                action_names = {action_name for action_name, _, _ in actions}
                 if AuditAction.CREATE.value not in action_names:
                     issues.append(f"{entity_type}:{entity_id} missing create audit.")
-                if int(record["is_deleted"]) == 1 and AuditAction.DELETE.value not in action_names:
+                if int(is_deleted) == 1 and AuditAction.DELETE.value not in action_names:
                     issues.append(f"{entity_type}:{entity_id} missing delete audit.")
 
-                for action in actions:
-                    action_name = str(action["action"])
-                    if action_name == AuditAction.CREATE.value and not action["after_state"]:
+                for action_name, has_before, has_after in actions:
+                    if action_name == AuditAction.CREATE.value and not has_after:
                         issues.append(
                             f"{entity_type}:{entity_id} create audit missing after_state."
                         )
                     if action_name == AuditAction.UPDATE.value and (
-                        not action["before_state"] or not action["after_state"]
+                        not has_before or not has_after
                     ):
                         issues.append(
                             f"{entity_type}:{entity_id} update audit missing state snapshot."
                         )
-                    if action_name == AuditAction.DELETE.value and not action["before_state"]:
+                    if action_name == AuditAction.DELETE.value and not has_before:
                         issues.append(
                             f"{entity_type}:{entity_id} delete audit missing before_state."
                         )
@@ -1123,11 +1098,13 @@ class GraphService:
 
     @staticmethod
     def _normalize_snapshot_name(name: str) -> str:
+        # str.strip() hands back the same object when there is nothing to
+        # trim, so clean names cost only the length check.
         normalized = name.strip()
         if not normalized:
             raise ValueError("`name` is required.")
-        if len(normalized) > 120:
-            raise ValueError("`name` is too long (max 120 characters).")
+        if len(normalized) > MAX_SNAPSHOT_NAME_LENGTH:
+            raise ValueError(f"`name` is too long (max {MAX_SNAPSHOT_NAME_LENGTH} characters).")
         return normalized
 
     @staticmethod
@@ -1136,69 +1113,211 @@ class GraphService:
 
     @staticmethod
     def _insert_audit(conn: sqlite3.Connection, log: AuditLog) -> None:
-        conn.execute(
-            """
-            INSERT INTO audits (
-                entity_type, entity_id, action,
-                actor, reason,
-                before_state, after_state,
-                created_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                log.entity_type,
-                log.entity_id,
-                log.action,
-                log.actor,
-                log.reason,
-                json.dumps(log.before_state, ensure_ascii=False) if log.before_state else None,
-                json.dumps(log.after_state, ensure_ascii=False) if log.after_state else None,
-                log.timestamp,
-            ),
+        conn.execute(_SQL_INSERT_AUDIT, GraphService._audit_to_row(log))
+
+    @staticmethod
+    def _insert_audit_many(conn: sqlite3.Connection, logs: list[AuditLog]) -> None:
+        if logs:
+            conn.executemany(_SQL_INSERT_AUDIT, [GraphService._audit_to_row(log) for log in logs])
+
+    @staticmethod
+    def _soft_delete_live_graph(
+        conn: sqlite3.Connection,
+        *,
+        actor: str,
+        reason: str,
+        now: str,
+    ) -> tuple[int, int]:
+        """Soft-delete every live row with delete audits; return (nodes, connections).
+
+        Audit states come from ``to_state()`` like every other write path;
+        the soft delete itself is one set-based UPDATE per table.
+        """
+        audit_logs: list[AuditLog] = []
+        tables = (
+            (EntityType.CONNECTION, _SQL_SELECT_LIVE_CONNECTIONS, _SQL_SOFT_DELETE_ALL_CONNECTIONS),
+            (EntityType.NODE, _SQL_SELECT_LIVE_NODES, _SQL_SOFT_DELETE_ALL_NODES),
+        )
+        cleared: dict[EntityType, int] = {}
+        for entity_type, select_sql, soft_delete_sql in tables:
+            rows = conn.execute(select_sql).fetchall()
+            entities = (
+                GraphService._rows_to_connections(rows)
+                if entity_type is EntityType.CONNECTION
+                else GraphService._rows_to_nodes(rows)
+            )
+            for entity in entities:
+                before_state = entity.to_state()
+                audit_logs.append(
+                    AuditLog(
+                        entity_type=entity_type.value,
+                        entity_id=entity.id,
+                        action=AuditAction.DELETE.value,
+                        actor=actor,
+                        timestamp=now,
+                        reason=reason,
+                        before_state=before_state,
+                        after_state=_soft_deleted_state(before_state, now),
+                    )
+                )
+            if rows:
+                conn.execute(soft_delete_sql, (now,))
+            cleared[entity_type] = len(rows)
+
+        GraphService._insert_audit_many(conn, audit_logs)
+        return cleared[EntityType.NODE], cleared[EntityType.CONNECTION]
+
+    @staticmethod
+    def _audit_to_row(log: AuditLog) -> tuple[object, ...]:
+        return (
+            log.entity_type,
+            log.entity_id,
+            log.action,
+            log.actor,
+            log.reason,
+            dumps_compact(log.before_state) if log.before_state else None,
+            dumps_compact(log.after_state) if log.after_state else None,
+            log.timestamp,
         )
 
     @staticmethod
-    def _row_to_node(row: sqlite3.Row) -> Node:
-        tags = _safe_json_loads(row["tags"], [])
-        evidence = _safe_json_loads(row["evidence"], [])
-
-        tags_list = [str(item) for item in tags] if isinstance(tags, list) else []
-        evidence_list = [str(item) for item in evidence] if isinstance(evidence, list) else []
-
-        return Node.from_state(
-            {
-                "id": str(row["id"]),
-                "content": str(row["content"]),
-                "summary": str(row["summary"]),
-                "position": {
-                    "x": float(row["position_x"]),
-                    "y": float(row["position_y"]),
-                },
-                "color": str(row["color"]),
-                "size": float(row["size"]),
-                "tags": tags_list,
-                "confidence": float(row["confidence"]),
-                "evidence": evidence_list,
-                "created_at": str(row["created_at"]),
-                "updated_at": str(row["updated_at"]),
-                "version": int(row["version"]),
-                "is_deleted": bool(row["is_deleted"]),
-            }
+    def _node_to_row(node: Node) -> tuple[object, ...]:
+        """Flatten a node into ``NODE_COLUMNS`` order."""
+        return (
+            node.id,
+            node.content,
+            node.summary,
+            node.position.x,
+            node.position.y,
+            node.color,
+            node.size,
+            _dumps_str_list(node.tags),
+            node.confidence,
+            _dumps_str_list(node.evidence),
+            node.created_at,
+            node.updated_at,
+            node.version,
+            int(node.is_deleted),
         )
 
     @staticmethod
-    def _row_to_connection(row: sqlite3.Row) -> Connection:
-        return Connection.from_state(
-            {
-                "id": str(row["id"]),
-                "source_id": str(row["source_id"]),
-                "target_id": str(row["target_id"]),
-                "conn_type": str(row["conn_type"]),
-                "description": str(row["description"]),
-                "strength": float(row["strength"]),
-                "created_at": str(row["created_at"]),
-                "updated_at": str(row["updated_at"]),
-                "version": int(row["version"]),
-                "is_deleted": bool(row["is_deleted"]),
-            }
+    def _connection_to_row(edge: Connection) -> tuple[object, ...]:
+        """Flatten a connection into ``CONNECTION_COLUMNS`` order."""
+        return (
+            edge.id,
+            edge.source_id,
+            edge.target_id,
+            edge.conn_type,
+            edge.description,
+            edge.strength,
+            edge.created_at,
+            edge.updated_at,
+            edge.version,
+            int(edge.is_deleted),
+        )
+
+    @staticmethod
+    def _row_to_node(row: Sequence[Any]) -> Node:
+        # Rows follow NODE_COLUMNS, so both sqlite3.Row and plain tuples from
+        # the hot read paths unpack positionally. Columns are NOT NULL with
+        # matching affinities, so values map straight onto the dataclass.
+        (
+            node_id,
+            content,
+            summary,
+            position_x,
+            position_y,
+            color,
+            size,
+            tags_raw,
+            confidence,
+            evidence_raw,
+            created_at,
+            updated_at,
+            version,
+            is_deleted,
+        ) = row
+        return Node(
+            id=str(node_id),
+            content=str(content),
+            summary=str(summary),
+            position=Position(float(position_x), float(position_y)),
+            color=str(color),
+            size=float(size),
+            tags=_loads_str_list(tags_raw),
+            confidence=float(confidence),
+            evidence=_loads_str_list(evidence_raw),
+            created_at=str(created_at),
+            updated_at=str(updated_at),
+            version=int(version),
+            is_deleted=bool(is_deleted),
         )
+
+    @staticmethod
+    def _row_to_connection(row: Sequence[Any]) -> Connection:
+        # Rows follow CONNECTION_COLUMNS; see _row_to_node.
+        (
+            conn_id,
+            source_id,
+            target_id,
+            conn_type,
+            description,
+            strength,
+            created_at,
+            updated_at,
+            version,
+            is_deleted,
+        ) = row
+        if conn_type not in _CONNECTION_TYPE_VALUES:
+            conn_type = ConnectionType.RELATES.value
+
+        return Connection(
+            id=str(conn_id),
+            source_id=str(source_id),
+            target_id=str(target_id),
+            conn_type=str(conn_type),
+            description=str(description),
+            strength=float(strength),
+            created_at=str(created_at),
+            updated_at=str(updated_at),
+            version=int(version),
+            is_deleted=bool(is_deleted),
+        )
+
+    @staticmethod
+    def _row_to_connection_state(row: Sequence[Any]) -> JsonObject:
+        """Render a connections row as ``Connection.to_state()`` without building a Connection."""
+        (
+            conn_id,
+            source_id,
+            target_id,
+            conn_type,
+            description,
+            strength,
+            created_at,
+            updated_at,
+            version,
+            is_deleted,
+        ) = row
+        if conn_type not in _CONNECTION_TYPE_VALUES:
+            conn_type = ConnectionType.RELATES.value
+        return {
+            "id": str(conn_id),
+            "source_id": str(source_id),
+            "target_id": str(target_id),
+            "conn_type": str(conn_type),
+            "description": str(description),
+            "strength": float(strength),
+            "created_at": str(created_at),
+            "updated_at": str(updated_at),
+            "version": int(version),
+            "is_deleted": bool(is_deleted),
+        }
+
+    @staticmethod
+    def _rows_to_nodes(rows: Iterable[Sequence[Any]]) -> list[Node]:
+        return list(map(GraphService._row_to_node, rows))
+
+    @staticmethod
+    def _rows_to_connections(rows: Iterable[Sequence[Any]]) -> list[Connection]:
+        return list(map(GraphService._row_to_connection, rows))
@@ -2,9 +2,19 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import re
-from typing import Any
+import sqlite3
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Sequence, cast
 
 from backend.i18n import (
     get_llm_prompt_items,
@@ -12,6 +22,7 @@ from backend.i18n import (
     normalize_prompt_language,
     render_llm_prompt_template,
 )
+from backend.json_codec import dumps_compact, loads_json
 from config import LLMConfig
 from datamodels.ai_llm_models import (
     LLMChatRequest,
@@ -22,12 +33,188 @@ from datamodels.ai_llm_models import (
 from datamodels.graph_models import ConnectionType, GraphSnapshot
 
 
-API_BACKENDS = {"remote_api", "local_api"}
-RUNTIME_BACKENDS = {"onnxruntime", "openvino"}
+API_BACKENDS = frozenset({"remote_api", "local_api"})
+RUNTIME_BACKENDS = frozenset({"onnxruntime", "openvino"})
+
+_CONNECTION_TYPE_VALUES: frozenset[str] = frozenset(ConnectionType.values())
+_CONNECTION_TYPES_TEXT = " / ".join(sorted(_CONNECTION_TYPE_VALUES))
+
+_JSON_DECODER = json.JSONDecoder()
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+_CONFLICT_WORD_RE = re.compile("conflict", re.IGNORECASE)
+# Upper bound on "{" offsets tried when pulling a JSON object out of prose.
+_MAX_JSON_SCAN_ATTEMPTS = 32
+
+# Rule-based review reasons per language: empty node, self-loop, dangling
+# node reference, invalid type prefix and the contradictory-pair prefix
+# (followed by "source -> target").
+_RULE_CONFLICT_REASONS: dict[str, tuple[str, str, str, str, str]] = {
+    "en": (
+        "Node content is empty.",
+        "Connection is a self-loop (source_id == target_id).",
+        "Connection references a non-existing node id.",
+        "Invalid connection type",
+        "Both supports and opposes exist for the same directed pair: ",
+    ),
+    "zh": (
+        "\u8282\u70b9 content \u4e3a\u7a7a\u3002",
+        "\u8fde\u63a5\u5b58\u5728\u81ea\u73af (source_id == target_id)\u3002",
+        "\u8fde\u63a5\u5f15\u7528\u4e86\u4e0d\u5b58\u5728\u7684\u8282\u70b9 id\u3002",
+        "\u8fde\u63a5\u7c7b\u578b\u65e0\u6548",
+        "\u540c\u4e00\u65b9\u5411\u8282\u70b9\u540c\u65f6\u5b58\u5728 supports \u4e0e opposes \u5173\u7cfb: ",
+    ),
+}
+_DEFAULT_CONFLICT_REASON: dict[str, str] = {
+    "en": "No reason provided.",
+    "zh": "\u672a\u63d0\u4f9b\u539f\u56e0\u3002",
+}
+
+ASK_MANY_CONCURRENCY = 8
+PROMPT_CACHE_SIZE = 128
+# Answers sampled above this temperature are meant to vary between calls.
+PROMPT_CACHE_MAX_TEMPERATURE = 0.3
+# Shared API clients kept alive; enough for the remote and local endpoints
+# plus a recently replaced key while a settings change settles.
+API_CLIENT_CACHE_SIZE = 4
+
+
+@lru_cache(maxsize=8)
+def _graph_generate_system_prompt_text(language: str) -> str:
+    """Assemble the graph generation system prompt once per language."""
+    base_prompt = get_llm_prompt_text(language, "graph_generate_system_prompt_base")
+    summary_rule = get_llm_prompt_text(language, "graph_generate_system_summary_rule")
+    connection_rule = get_llm_prompt_text(language, "graph_generate_system_connection_rule")
+    confidence_rule = get_llm_prompt_text(language, "graph_generate_system_confidence_rule")
+    return (
+        f"{base_prompt}\n"
+        f"{summary_rule}\n"
+        f"{connection_rule}\n"
+        f"{confidence_rule}"
+    )
+
+
+class _PersistentAnswerStore:
+    """SQLite-backed answer cache with expiry, shared across processes.
+
+    Every failure is swallowed: the store only ever saves model calls and
+    must never turn a cache problem into a failed request.
+    """
+
+    def __init__(self, path: str, ttl_seconds: int) -> None:
+        self._ttl = float(ttl_seconds)
+        self._lock = threading.Lock()
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=5.0, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS llm_responses (
+                key BLOB PRIMARY KEY,
+                answer TEXT NOT NULL,
+                expires_at REAL NOT NULL
+            ) WITHOUT ROWID
+            """
+        )
+        self._conn.execute("DELETE FROM llm_responses WHERE expires_at <= ?", (time.time(),))
+        self._conn.commit()
+
+    def get(self, key: bytes) -> str | None:
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT answer FROM llm_responses WHERE key = ? AND expires_at > ?",
+                    (key, time.time()),
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+        return None if row is None else str(row[0])
+
+    def put(self, key: bytes, answer: str) -> None:
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO llm_responses (key, answer, expires_at) VALUES (?, ?, ?)",
+                    (key, answer, time.time() + self._ttl),
+                )
+        except sqlite3.Error:
+            pass
+
+
+class _PromptCache:
+    """Bounded, thread-safe LRU of answers keyed by a digest of the request.
+
+    An optional persistent store backs the LRU so answers survive restarts
+    and are shared between worker processes.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = PROMPT_CACHE_SIZE,
+        store: _PersistentAnswerStore | None = None,
+    ) -> None:
+        self._maxsize = maxsize
+        self._entries: OrderedDict[bytes, str] = OrderedDict()
+        self._lock = threading.Lock()
+        self._store = store
+
+    @staticmethod
+    def key(backend: str, base_url: str, model: str, payload: LLMChatRequest) -> bytes:
+        # base_url is part of the key: the persistent store is shared, and
+        # two endpoints may serve different models under the same name.
+        digest = hashlib.blake2b(digest_size=16)
+        for part in (
+            backend,
+            base_url,
+            model,
+            payload.system_prompt or "",
+            payload.prompt.strip(),
+            f"{float(payload.temperature):.2f}",
+            str(max(int(payload.max_tokens), 1)),
+        ):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\x00")
+        return digest.digest()
+
+    def get(self, key: bytes) -> str | None:
+        with self._lock:
+            answer = self._entries.get(key)
+            if answer is not None:
+                self._entries.move_to_end(key)
+                return answer
+        if self._store is None:
+            return None
+        answer = self._store.get(key)
+        if answer is not None:
+            self._remember(key, answer)
+        return answer
+
+    def put(self, key: bytes, answer: str) -> None:
+        if not answer:
+            # An empty reply is a failed generation, not an answer to reuse.
+            return
+        self._remember(key, answer)
+        if self._store is not None:
+            self._store.put(key, answer)
+
+    def _remember(self, key: bytes, answer: str) -> None:
+        with self._lock:
+            self._entries[key] = answer
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
 
 
 class LLMService:
 
+    # API clients keyed by (base_url, api key digest). Settings saves rebuild
+    # the service, and sharing the client keeps its HTTP connection pool warm.
+    # The LRU bound stops each new key or URL from pinning another client;
+    # evicted clients are not closed, since an older service may still be
+    # streaming through them, and are freed once that service is dropped.
+    _client_cache: OrderedDict[tuple[str, str], Any] = OrderedDict()
+    _client_cache_lock = threading.Lock()
+
     def __init__(
         self,
         llm_config: LLMConfig | None = None,
@@ -35,11 +222,13 @@ class LLMService:
         base_url: str | None = None,
         model: str | None = None,
         backend: str | None = None,
+        response_cache_path: str | None = None,
     ) -> None:
         config = llm_config or LLMConfig.from_env()
 
         self.config = config
-        self.backend = (backend or config.backend).strip().lower()
+        # Checked against the backend name sets on every request.
+        self.backend = sys.intern((backend or config.backend).strip().lower())
 
         self.api_key: str | None = api_key
         self.base_url: str = base_url or ""
@@ -48,6 +237,11 @@ class LLMService:
         self._client: Any | None = None
         self._local_backend: Any | None = None
         self._disabled_reason: str | None = None
+        self._prompt_cache = _PromptCache(
+            store=self._open_response_store(response_cache_path, config.response_cache_ttl)
+        )
+        # Local runtimes keep one model instance shared by request threads.
+        self._local_lock = threading.Lock()
 
         if self.backend in API_BACKENDS:
             self._init_api_backend(
@@ -65,6 +259,15 @@ class LLMService:
                 f"Current: {self.backend}"
             )
 
+    @staticmethod
+    def _open_response_store(path: str | None, ttl_seconds: int) -> _PersistentAnswerStore | None:
+        if not path or ttl_seconds <= 0:
+            return None
+        try:
+            return _PersistentAnswerStore(path, ttl_seconds)
+        except (OSError, sqlite3.Error):
+            return None
+
     @property
     def enabled(self) -> bool:
         if self.backend in API_BACKENDS:
@@ -73,9 +276,7 @@ class LLMService:
             return self._local_backend is not None
         return False
 
-    @staticmethod
-    def _normalize_language(language: str | None) -> str:
-        return normalize_prompt_language(language)
+    _normalize_language = staticmethod(normalize_prompt_language)
 
     def _review_system_prompt(self, language: str) -> str:
         return get_llm_prompt_text(language, "review_system_prompt")
@@ -84,20 +285,28 @@ class LLMService:
         return get_llm_prompt_text(language, "chat_graph_system_prompt")
 
     def _graph_generate_system_prompt(self, language: str) -> str:
-        base_prompt = get_llm_prompt_text(language, "graph_generate_system_prompt_base")
-        summary_rule = get_llm_prompt_text(language, "graph_generate_system_summary_rule")
-        connection_rule = get_llm_prompt_text(language, "graph_generate_system_connection_rule")
-        confidence_rule = get_llm_prompt_text(language, "graph_generate_system_confidence_rule")
-        return (
-            f"{base_prompt}\n"
-            f"{summary_rule}\n"
-            f"{connection_rule}\n"
-            f"{confidence_rule}"
-        )
+        return _graph_generate_system_prompt_text(language)
 
     def _thinking_graph_paradigm(self, language: str) -> tuple[str, ...]:
         return get_llm_prompt_items(language, "thinking_graph_paradigm")
 
+    @classmethod
+    def _shared_api_client(cls, api_key: str, base_url: str) -> Any:
+        key = (base_url, hashlib.blake2b(api_key.encode("utf-8"), digest_size=16).hexdigest())
+        with cls._client_cache_lock:
+            client = cls._client_cache.get(key)
+            if client is not None:
+                cls._client_cache.move_to_end(key)
+                return client
+
+            from openai import OpenAI
+
+            client = OpenAI(api_key=api_key, base_url=base_url)
+            cls._client_cache[key] = client
+            if len(cls._client_cache) > API_CLIENT_CACHE_SIZE:
+                cls._client_cache.popitem(last=False)
+            return client
+
     def _init_api_backend(
         self,
         *,
@@ -124,9 +333,7 @@ class LLMService:
             return
 
         try:
-            from openai import OpenAI
-
-            self._client = OpenAI(api_key=self.api_key, base_url=self.base_url)
+            self._client = self._shared_api_client(self.api_key or "", self.base_url)
         except Exception as exc:
             self._disabled_reason = f"Failed to initialize API client: {exc}"
 
@@ -147,6 +354,8 @@ class LLMService:
                 device=runtime_profile.npu_device,
                 require_npu=runtime_profile.require_npu,
                 onnx_provider=runtime_profile.onnx_provider,
+                inference_precision=runtime_profile.inference_precision,
+                draft_model_name=runtime_profile.draft_model,
             )
         except Exception as exc:
             self._disabled_reason = f"Failed to initialize {self.backend} backend: {exc}"
@@ -172,6 +381,12 @@ class LLMService:
                 or "LLM backend is unavailable. Check backend/runtime configuration.",
             )
 
+        cache_key = self._prompt_cache_key(request_payload, graph_snapshot)
+        if cache_key is not None:
+            cached = self._prompt_cache.get(cache_key)
+            if cached is not None:
+                return LLMChatResponse(enabled=True, model=self.model, response=cached)
+
         try:
             if self.backend in API_BACKENDS:
                 answer = self._ask_api(request_payload)
@@ -184,8 +399,108 @@ class LLMService:
                 response=f"{self.backend} request failed: {exc}",
             )
 
+        if cache_key is not None:
+            self._prompt_cache.put(cache_key, answer)
         return LLMChatResponse(enabled=True, model=self.model, response=answer)
 
+    def ask_stream(
+        self,
+        payload: LLMChatRequest,
+        graph_snapshot: GraphSnapshot | None = None,
+    ) -> Iterator[str]:
+        """Return an iterator of answer text chunks as they are generated.
+
+        The prompt is validated and the backend checked before the iterator
+        is returned; backend errors raised while streaming propagate to the
+        consumer. Local runtimes and cache hits produce a single chunk.
+        """
+        if not payload.prompt.strip():
+            raise ValueError("`prompt` is required.")
+        if not self.enabled:
+            raise RuntimeError(
+                self._disabled_reason
+                or "LLM backend is unavailable. Check backend/runtime configuration."
+            )
+
+        request_payload = payload
+        if graph_snapshot is not None:
+            request_payload = self._attach_graph_context(payload, graph_snapshot)
+        cache_key = self._prompt_cache_key(request_payload, graph_snapshot)
+        return self._stream_answer(request_payload, cache_key)
+
+    def _stream_answer(self, payload: LLMChatRequest, cache_key: bytes | None) -> Iterator[str]:
+        if cache_key is not None:
+            cached = self._prompt_cache.get(cache_key)
+            if cached is not None:
+                yield cached
+                return
+
+        if self.backend not in API_BACKENDS:
+            answer = self._ask_local_runtime(payload)
+            if cache_key is not None:
+                self._prompt_cache.put(cache_key, answer)
+            yield answer
+            return
+
+        assert self._client is not None
+        stream = self._client.chat.completions.create(
+            model=self.model,
+            messages=self._build_messages(payload),
+            temperature=float(payload.temperature),
+            max_tokens=max(int(payload.max_tokens), 1),
+            stream=True,
+        )
+        chunks: list[str] = []
+        for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if delta:
+                chunks.append(delta)
+                yield delta
+        if cache_key is not None:
+            self._prompt_cache.put(cache_key, "".join(chunks).strip())
+
+    def _prompt_cache_key(
+        self,
+        request_payload: LLMChatRequest,
+        graph_snapshot: GraphSnapshot | None,
+    ) -> bytes | None:
+        # Prompts carrying the live graph change with every edit, and hotter
+        # sampling is expected to vary, so only stable requests are cached.
+        if graph_snapshot is not None or request_payload.temperature > PROMPT_CACHE_MAX_TEMPERATURE:
+            return None
+        return _PromptCache.key(self.backend, self.base_url, self.model, request_payload)
+
+    def ask_many(
+        self,
+        payloads: Sequence[LLMChatRequest],
+        *,
+        concurrency: int = ASK_MANY_CONCURRENCY,
+    ) -> list[LLMChatResponse]:
+        """Run several independent ``ask`` calls, returning answers in input order.
+
+        API backends overlap the network round-trips on a small thread pool
+        sharing the client's connection pool. Local runtimes that implement
+        ``generate_batch`` decode requests sharing sampling settings as one
+        batch; other local runtimes run one request at a time.
+        """
+        if not payloads:
+            return []
+        if (
+            self.backend in RUNTIME_BACKENDS
+            and self.enabled
+            and hasattr(self._local_backend, "generate_batch")
+        ):
+            return self._ask_local_runtime_batched(payloads)
+
+        workers = min(max(int(concurrency), 1), len(payloads))
+        if workers == 1 or self.backend not in API_BACKENDS or not self.enabled:
+            return [self.ask(payload) for payload in payloads]
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="llm-ask") as executor:
+            return list(executor.map(self.ask, payloads))
+
     def _attach_graph_context(
         self,
         payload: LLMChatRequest,
@@ -198,15 +513,19 @@ class LLMService:
             "[END_CURRENT_THINKING_GRAPH_JSON]\n"
         )
 
+        # In the user message the graph goes first and the per-request
+        # question last, so repeated questions about the same graph share a
+        # long identical prefix that provider-side prompt caching can reuse.
+        # A caller-supplied system prompt still takes precedence over the
+        # built-in graph rules.
         language = self._normalize_language(payload.language)
         merged_system_prompt = self._chat_graph_system_prompt(language)
         if payload.system_prompt:
-            merged_system_prompt = (
-                f"{payload.system_prompt.strip()}\n\n{self._chat_graph_system_prompt(language)}"
-            )
+            merged_system_prompt = f"{payload.system_prompt.strip()}\n\n{merged_system_prompt}"
 
         graph_instruction = get_llm_prompt_text(language, "attach_graph_instruction")
-        merged_prompt = f"{payload.prompt.strip()}\n\n{graph_instruction}{graph_block}"
+        question_label = get_llm_prompt_text(language, "attach_graph_question_label")
+        merged_prompt = f"{graph_block}\n{graph_instruction}{question_label}{payload.prompt.strip()}"
 
         return LLMChatRequest(
             prompt=merged_prompt,
@@ -244,33 +563,85 @@ class LLMService:
                 for conn in snapshot.connections
             ],
         }
-        return json.dumps(payload, ensure_ascii=False)
+        # Compact separators also keep the prompt a few tokens shorter.
+        return dumps_compact(payload)
 
     def _ask_api(self, payload: LLMChatRequest) -> str:
         assert self._client is not None
 
-        messages: list[dict[str, str]] = []
-        if payload.system_prompt:
-            messages.append({"role": "system", "content": payload.system_prompt})
-        messages.append({"role": "user", "content": payload.prompt.strip()})
-
         completion = self._client.chat.completions.create(
             model=self.model,
-            messages=messages,
+            messages=self._build_messages(payload),
             temperature=float(payload.temperature),
             max_tokens=max(int(payload.max_tokens), 1),
         )
         return (completion.choices[0].message.content or "").strip()
 
+    @staticmethod
+    def _build_messages(payload: LLMChatRequest) -> list[dict[str, str]]:
+        messages: list[dict[str, str]] = []
+        if payload.system_prompt:
+            messages.append({"role": "system", "content": payload.system_prompt})
+        messages.append({"role": "user", "content": payload.prompt.strip()})
+        return messages
+
     def _ask_local_runtime(self, payload: LLMChatRequest) -> str:
         assert self._local_backend is not None
 
-        return self._local_backend.generate(
-            payload.prompt,
-            system_prompt=payload.system_prompt,
-            temperature=float(payload.temperature),
-            max_new_tokens=max(int(payload.max_tokens), 1),
-        )
+        with self._local_lock:
+            return self._local_backend.generate(
+                payload.prompt,
+                system_prompt=payload.system_prompt,
+                temperature=float(payload.temperature),
+                max_new_tokens=max(int(payload.max_tokens), 1),
+            )
+
+    def _ask_local_runtime_batched(self, payloads: Sequence[LLMChatRequest]) -> list[LLMChatResponse]:
+        assert self._local_backend is not None
+
+        responses: list[LLMChatResponse | None] = [None] * len(payloads)
+        cache_keys: list[bytes | None] = []
+        # Requests are binned by sampling settings so one batch never waits
+        # on a much longer generation budget than its own.
+        batches: dict[tuple[float, int], list[int]] = {}
+        for index, payload in enumerate(payloads):
+            if not payload.prompt.strip():
+                raise ValueError("`prompt` is required.")
+            cache_key = self._prompt_cache_key(payload, None)
+            cache_keys.append(cache_key)
+            cached = self._prompt_cache.get(cache_key) if cache_key is not None else None
+            if cached is not None:
+                responses[index] = LLMChatResponse(enabled=True, model=self.model, response=cached)
+                continue
+            bin_key = (float(payload.temperature), max(int(payload.max_tokens), 1))
+            batches.setdefault(bin_key, []).append(index)
+
+        for (temperature, max_new_tokens), indexes in batches.items():
+            try:
+                with self._local_lock:
+                    answers = self._local_backend.generate_batch(
+                        [payloads[index].prompt for index in indexes],
+                        system_prompts=[payloads[index].system_prompt for index in indexes],
+                        temperature=temperature,
+                        max_new_tokens=max_new_tokens,
+                    )
+            except Exception as exc:
+                failure = LLMChatResponse(
+                    enabled=False,
+                    model=self.model or self.config.model,
+                    response=f"{self.backend} request failed: {exc}",
+                )
+                for index in indexes:
+                    responses[index] = failure
+                continue
+
+            for index, answer in zip(indexes, answers):
+                cache_key = cache_keys[index]
+                if cache_key is not None:
+                    self._prompt_cache.put(cache_key, answer)
+                responses[index] = LLMChatResponse(enabled=True, model=self.model, response=answer)
+
+        return cast(list[LLMChatResponse], responses)
 
     def generate_graph_from_topic(
         self,
@@ -382,15 +753,13 @@ class LLMService:
             "connection_count": len(connections),
         }
 
-    def _build_generate_graph_prompt(self, topic: str, *, max_nodes: int, language: str = "zh") -> str:
-        connection_types = " / ".join(sorted(ConnectionType.values()))
-        normalized_language = self._normalize_language(language)
+    def _build_generate_graph_prompt(self, topic: str, *, max_nodes: int, language: str) -> str:
         return render_llm_prompt_template(
-            normalized_language,
+            language,
             "generate_graph_prompt_template",
             topic=topic,
             max_nodes=max_nodes,
-            connection_types=connection_types,
+            connection_types=_CONNECTION_TYPES_TEXT,
         )
 
     def _resolve_generated_graph_summary(
@@ -471,13 +840,12 @@ class LLMService:
         target_node: dict[str, Any] | None,
         language: str,
     ) -> str:
-        normalized_language = self._normalize_language(language)
-        source_fallback = "source" if normalized_language == "en" else "\u6e90\u8282\u70b9"
-        target_fallback = "target" if normalized_language == "en" else "\u76ee\u6807\u8282\u70b9"
+        source_fallback = "source" if language == "en" else "\u6e90\u8282\u70b9"
+        target_fallback = "target" if language == "en" else "\u76ee\u6807\u8282\u70b9"
         source_text = self._node_hint_text(source_node) or source_fallback
         target_text = self._node_hint_text(target_node) or target_fallback
 
-        if normalized_language == "en":
+        if language == "en":
             templates = {
                 ConnectionType.SUPPORTS.value: f"{source_text} supports {target_text}.",
                 ConnectionType.OPPOSES.value: f"{source_text} opposes {target_text}.",
@@ -509,6 +877,9 @@ class LLMService:
 
         nodes: list[dict[str, Any]] = []
         used_node_ids: set[str] = set()
+        # Next free suffix per colliding id, so repeated ids from the model
+        # do not rescan every earlier suffix.
+        next_suffix: dict[str, int] = {}
 
         for index, item in enumerate(raw_nodes, start=1):
             if not isinstance(item, dict):
@@ -520,10 +891,13 @@ class LLMService:
 
             raw_id = str(item.get("id", "")).strip() or f"N{index}"
             node_id = raw_id
-            suffix = 2
-            while node_id in used_node_ids:
+            if node_id in used_node_ids:
+                suffix = next_suffix.get(raw_id, 2)
                 node_id = f"{raw_id}_{suffix}"
-                suffix += 1
+                while node_id in used_node_ids:
+                    suffix += 1
+                    node_id = f"{raw_id}_{suffix}"
+                next_suffix[raw_id] = suffix + 1
             used_node_ids.add(node_id)
 
             summary = str(item.get("summary", "")).strip()
@@ -552,7 +926,6 @@ class LLMService:
             return [], []
         self._ensure_generated_confidence_variation(nodes, language=language)
 
-        node_ids = {node["id"] for node in nodes}
         node_by_id = {node["id"]: node for node in nodes}
         raw_connections = payload.get("connections")
         connections: list[dict[str, Any]] = []
@@ -570,15 +943,15 @@ class LLMService:
                 not source_id
                 or not target_id
                 or source_id == target_id
-                or source_id not in node_ids
-                or target_id not in node_ids
+                or source_id not in node_by_id
+                or target_id not in node_by_id
             ):
                 continue
 
             conn_type = str(
                 item.get("conn_type", ConnectionType.RELATES.value)
             ).strip()
-            if conn_type not in ConnectionType.values():
+            if conn_type not in _CONNECTION_TYPE_VALUES:
                 conn_type = ConnectionType.RELATES.value
 
             description = self._normalize_generated_connection_description(
@@ -642,11 +1015,16 @@ class LLMService:
 
     def review_graph(self, snapshot: GraphSnapshot, *, language: str = "zh") -> LLMGraphReviewResponse:
         normalized_language = self._normalize_language(language)
-        rule_conflicts = self._rule_based_conflicts(snapshot, language=normalized_language)
+        rule_conflicts, has_structural_conflict = self._rule_based_conflicts(
+            snapshot,
+            language=normalized_language,
+        )
         llm_conflicts: list[LLMGraphConflict] = []
         raw_response = ""
 
-        if self.enabled:
+        # Broken structure (self-loops, dangling references, unknown types)
+        # already decides the verdict, so the model round-trip is skipped.
+        if self.enabled and not has_structural_conflict:
             prompt = self._build_review_prompt(snapshot, language=normalized_language)
             chat_result = self.ask(
                 LLMChatRequest(
@@ -662,11 +1040,11 @@ class LLMService:
                 raw_response,
                 language=normalized_language,
             )
-        else:
+        elif not self.enabled:
             raw_response = self._disabled_reason or "LLM backend is unavailable."
 
         conflicts = self._merge_conflicts(
-            rule_conflicts + llm_conflicts,
+            chain(rule_conflicts, llm_conflicts),
             language=normalized_language,
         )
         verdict = "OK" if not conflicts else "CONFLICT"
@@ -684,43 +1062,15 @@ class LLMService:
             paradigm=list(self._thinking_graph_paradigm(normalized_language)),
         )
 
-    def _build_review_prompt(self, snapshot: GraphSnapshot, *, language: str = "zh") -> str:
-        normalized_language = self._normalize_language(language)
+    def _build_review_prompt(self, snapshot: GraphSnapshot, *, language: str) -> str:
         paradigm_text = "\n".join(
             f"{index}. {item}"
-            for index, item in enumerate(self._thinking_graph_paradigm(normalized_language), start=1)
+            for index, item in enumerate(self._thinking_graph_paradigm(language), start=1)
         )
 
-        graph_payload = {
-            "node_count": len(snapshot.nodes),
-            "connection_count": len(snapshot.connections),
-            "nodes": [
-                {
-                    "id": node.id,
-                    "summary": node.summary,
-                    "content": node.content,
-                    "confidence": node.confidence,
-                    "tags": node.tags,
-                    "evidence": node.evidence,
-                }
-                for node in snapshot.nodes
-            ],
-            "connections": [
-                {
-                    "id": conn.id,
-                    "source_id": conn.source_id,
-                    "target_id": conn.target_id,
-                    "conn_type": conn.conn_type,
-                    "description": conn.description,
-                    "strength": conn.strength,
-                }
-                for conn in snapshot.connections
-            ],
-        }
-
-        graph_json = json.dumps(graph_payload, ensure_ascii=False)
+        graph_json = self._graph_snapshot_json(snapshot)
         return render_llm_prompt_template(
-            normalized_language,
+            language,
             "review_prompt_template",
             paradigm_text=paradigm_text,
             graph_json=graph_json,
@@ -730,29 +1080,24 @@ class LLMService:
         self,
         snapshot: GraphSnapshot,
         *,
-        language: str = "zh",
-    ) -> list[LLMGraphConflict]:
-        normalized_language = self._normalize_language(language)
+        language: str,
+    ) -> tuple[list[LLMGraphConflict], bool]:
+        """Return rule-detected conflicts and whether any is structural.
+
+        Structural conflicts (self-loops, dangling node references and
+        unknown connection types) decide the review on their own.
+        """
         conflicts: list[LLMGraphConflict] = []
+        structural = False
         node_ids = {node.id for node in snapshot.nodes}
-        connection_types = ConnectionType.values()
-
-        if normalized_language == "en":
-            node_empty_reason = "Node content is empty."
-            self_loop_reason = "Connection is a self-loop (source_id == target_id)."
-            invalid_node_ref_reason = "Connection references a non-existing node id."
-            invalid_conn_type_prefix = "Invalid connection type"
-            contradictory_reason_template = (
-                "Both supports and opposes exist for the same directed pair: {source} -> {target}"
-            )
-        else:
-            node_empty_reason = "\u8282\u70b9 content \u4e3a\u7a7a\u3002"
-            self_loop_reason = "\u8fde\u63a5\u5b58\u5728\u81ea\u73af (source_id == target_id)\u3002"
-            invalid_node_ref_reason = "\u8fde\u63a5\u5f15\u7528\u4e86\u4e0d\u5b58\u5728\u7684\u8282\u70b9 id\u3002"
-            invalid_conn_type_prefix = "\u8fde\u63a5\u7c7b\u578b\u65e0\u6548"
-            contradictory_reason_template = (
-                "\u540c\u4e00\u65b9\u5411\u8282\u70b9\u540c\u65f6\u5b58\u5728 supports \u4e0e opposes \u5173\u7cfb: {source} -> {target}"
-            )
+
+        (
+            node_empty_reason,
+            self_loop_reason,
+            invalid_node_ref_reason,
+            invalid_conn_type_prefix,
+            contradictory_reason_prefix,
+        ) = _RULE_CONFLICT_REASONS[language]
 
         for node in snapshot.nodes:
             if not node.content.strip():
@@ -764,11 +1109,20 @@ class LLMService:
                     )
                 )
 
-        pair_types: dict[tuple[str, str], set[str]] = {}
+        # Edge ids are grouped per directed pair in first-seen order; the
+        # two flag sets replace a per-pair set of every connection type.
         pair_connections: dict[tuple[str, str], list[str]] = {}
+        supports_pairs: set[tuple[str, str]] = set()
+        opposes_pairs: set[tuple[str, str]] = set()
+        supports_value = ConnectionType.SUPPORTS.value
+        opposes_value = ConnectionType.OPPOSES.value
 
         for conn in snapshot.connections:
-            if conn.source_id == conn.target_id:
+            source_id = conn.source_id
+            target_id = conn.target_id
+            conn_type = conn.conn_type
+            if source_id == target_id:
+                structural = True
                 conflicts.append(
                     LLMGraphConflict(
                         entity_type="connection",
@@ -777,7 +1131,8 @@ class LLMService:
                     )
                 )
 
-            if conn.source_id not in node_ids or conn.target_id not in node_ids:
+            if source_id not in node_ids or target_id not in node_ids:
+                structural = True
                 conflicts.append(
                     LLMGraphConflict(
                         entity_type="connection",
@@ -786,46 +1141,51 @@ class LLMService:
                     )
                 )
 
-            if conn.conn_type not in connection_types:
+            if conn_type not in _CONNECTION_TYPE_VALUES:
+                structural = True
                 conflicts.append(
                     LLMGraphConflict(
                         entity_type="connection",
                         entity_id=conn.id,
-                        reason=f"{invalid_conn_type_prefix}: {conn.conn_type}",
+                        reason=f"{invalid_conn_type_prefix}: {conn_type}",
                     )
                 )
 
-            pair_key = (conn.source_id, conn.target_id)
-            pair_types.setdefault(pair_key, set()).add(conn.conn_type)
-            pair_connections.setdefault(pair_key, []).append(conn.id)
-
-        for pair_key, kinds in pair_types.items():
-            if (
-                ConnectionType.SUPPORTS.value in kinds
-                and ConnectionType.OPPOSES.value in kinds
-            ):
+            pair_key = (source_id, target_id)
+            ids = pair_connections.get(pair_key)
+            if ids is None:
+                pair_connections[pair_key] = [conn.id]
+            else:
+                ids.append(conn.id)
+            if conn_type == supports_value:
+                supports_pairs.add(pair_key)
+            elif conn_type == opposes_value:
+                opposes_pairs.add(pair_key)
+
+        contradictory_pairs = supports_pairs & opposes_pairs
+        if contradictory_pairs:
+            for pair_key, conn_ids in pair_connections.items():
+                if pair_key not in contradictory_pairs:
+                    continue
                 source_id, target_id = pair_key
-                for conn_id in pair_connections.get(pair_key, []):
+                reason = f"{contradictory_reason_prefix}{source_id} -> {target_id}"
+                for conn_id in conn_ids:
                     conflicts.append(
                         LLMGraphConflict(
                             entity_type="connection",
                             entity_id=conn_id,
-                            reason=contradictory_reason_template.format(
-                                source=source_id,
-                                target=target_id,
-                            ),
+                            reason=reason,
                         )
                     )
 
-        return self._merge_conflicts(conflicts, language=normalized_language)
+        return self._merge_conflicts(conflicts, language=language), structural
 
     def _parse_review_response(
         self,
         raw_response: str,
         *,
-        language: str = "zh",
+        language: str,
     ) -> list[LLMGraphConflict]:
-        normalized_language = self._normalize_language(language)
         payload = self._extract_json_payload(raw_response)
         if payload is None:
             return self._heuristic_conflicts(raw_response)
@@ -836,11 +1196,7 @@ class LLMService:
 
         conflicts_raw = payload.get("conflicts")
         conflicts: list[LLMGraphConflict] = []
-        default_reason = (
-            "No reason provided."
-            if normalized_language == "en"
-            else "\u672a\u63d0\u4f9b\u539f\u56e0\u3002"
-        )
+        default_reason = _DEFAULT_CONFLICT_REASON[language]
 
         if isinstance(conflicts_raw, list):
             for item in conflicts_raw:
@@ -869,7 +1225,7 @@ class LLMService:
         if not conflicts and result and result != "OK":
             fallback_reason = (
                 "LLM marked CONFLICT but did not return a structured conflicts list."
-                if normalized_language == "en"
+                if language == "en"
                 else "LLM \u6807\u8bb0\u4e86\u51b2\u7a81\uff0c\u4f46\u672a\u8fd4\u56de\u7ed3\u6784\u5316 conflicts \u5217\u8868\u3002"
             )
             conflicts.append(
@@ -879,7 +1235,7 @@ class LLMService:
                     reason=fallback_reason,
                 )
             )
-        return self._merge_conflicts(conflicts, language=normalized_language)
+        return self._merge_conflicts(conflicts, language=language)
 
     @staticmethod
     def _extract_json_payload(raw_response: str) -> dict[str, Any] | None:
@@ -888,22 +1244,38 @@ class LLMService:
             return None
 
         if text.startswith("```"):
-            text = re.sub(r"^```(?:json)?\s*", "", text, flags=re.IGNORECASE)
-            text = re.sub(r"\s*```$", "", text).strip()
+            # Fixed delimiters, so plain slicing replaces the fence regexes.
+            text = text[3:]
+            if text[:4].lower() == "json":
+                text = text[4:]
+            text = text.strip()
+            if text.endswith("```"):
+                text = text[:-3].rstrip()
+
+        # Only text that starts with "{" can parse whole into an object;
+        # anything else would be a guaranteed failed parse.
+        if text.startswith("{"):
+            try:
+                payload = loads_json(text)
+            except json.JSONDecodeError:
+                payload = None
+            if isinstance(payload, dict):
+                return payload
 
-        candidates = [text]
+        # Models often wrap the object in prose. raw_decode parses one value
+        # from a given offset and ignores whatever follows it, so trying
+        # each "{" in turn finds the first complete object without slicing.
         start = text.find("{")
-        end = text.rfind("}")
-        if 0 <= start < end:
-            candidates.append(text[start : end + 1])
-
-        for candidate in candidates:
+        attempts = 0
+        while start != -1 and attempts < _MAX_JSON_SCAN_ATTEMPTS:
             try:
-                payload = json.loads(candidate)
+                payload, _ = _JSON_DECODER.raw_decode(text, start)
             except json.JSONDecodeError:
-                continue
+                payload = None
             if isinstance(payload, dict):
                 return payload
+            attempts += 1
+            start = text.find("{", start + 1)
 
         return None
 
@@ -913,11 +1285,12 @@ class LLMService:
         if not text:
             return []
 
-        lowered = text.lower()
-        if lowered == "ok":
+        # Only a two-character answer can be "ok"; longer replies are scanned
+        # in place rather than lowercased into a full-size copy.
+        if len(text) == 2 and text.lower() == "ok":
             return []
 
-        if "conflict" in lowered or "\u51b2\u7a81" in text or "\u65e0\u6548" in text:
+        if "\u51b2\u7a81" in text or "\u65e0\u6548" in text or _CONFLICT_WORD_RE.search(text):
             return [
                 LLMGraphConflict(
                     entity_type="global",
@@ -930,19 +1303,14 @@ class LLMService:
 
     @staticmethod
     def _merge_conflicts(
-        conflicts: list[LLMGraphConflict],
+        conflicts: Iterable[LLMGraphConflict],
         *,
-        language: str = "zh",
+        language: str,
     ) -> list[LLMGraphConflict]:
-        normalized_language = "en" if (language or "").strip().lower() == "en" else "zh"
-        default_reason = (
-            "No reason provided."
-            if normalized_language == "en"
-            else "\u672a\u63d0\u4f9b\u539f\u56e0\u3002"
-        )
+        default_reason = _DEFAULT_CONFLICT_REASON[language]
 
-        merged: list[LLMGraphConflict] = []
-        seen: set[tuple[str, str, str]] = set()
+        # Insertion-ordered dict: one structure both dedupes and keeps order.
+        merged: dict[tuple[str, str, str], LLMGraphConflict] = {}
 
         for conflict in conflicts:
             key = (
@@ -950,18 +1318,20 @@ class LLMService:
                 conflict.entity_id.strip() or "global",
                 conflict.reason.strip(),
             )
-            if key in seen:
+            if key in merged:
                 continue
-            seen.add(key)
-            merged.append(
-                LLMGraphConflict(
-                    entity_type=key[0],
-                    entity_id=key[1],
-                    reason=key[2] or default_reason,
-                )
+            # Conflicts that are already normalized (every rule-based one)
+            # are kept as-is instead of being copied.
+            if key[2] and key == (conflict.entity_type, conflict.entity_id, conflict.reason):
+                merged[key] = conflict
+                continue
+            merged[key] = LLMGraphConflict(
+                entity_type=key[0],
+                entity_id=key[1],
+                reason=key[2] or default_reason,
             )
 
-        return merged
+        return list(merged.values())
 
     @staticmethod
     def _conflicts_to_text(conflicts: list[LLMGraphConflict]) -> str:
@@ -991,6 +1361,7 @@ class LLMService:
 
     @staticmethod
     def _normalize_hex_color(value: str | None) -> str:
-        if value and re.fullmatch(r"#(?:[0-9a-fA-F]{6})", value):
+        # "#rrggbb": a length check plus a set test, no regex per node.
+        if value and len(value) == 7 and value[0] == "#" and _HEX_DIGITS.issuperset(value[1:]):
             return value.lower()
         return "#157f83"
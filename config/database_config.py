@@ -7,12 +7,15 @@ from pathlib import Path
 from typing import Mapping
 import os
 
+from config.coercion import to_int
 from config.paths_config import PathsConfig
 
 
 @dataclass(slots=True)
 class DatabaseConfig:
     db_path: str
+    synchronous: str = "NORMAL"
+    pool_size: int = 5
 
     @classmethod
     def from_sources(
@@ -28,7 +31,10 @@ class DatabaseConfig:
         db_path_raw = os.getenv("THINKING_GRAPH_DB", default_path_raw)
         db_path = _resolve_path(db_path_raw, paths.project_root)
 
-        return cls(db_path=db_path)
+        synchronous = _to_str(section.get("synchronous"), "NORMAL").upper()
+        pool_size = max(to_int(section.get("pool_size"), 5), 1)
+
+        return cls(db_path=db_path, synchronous=synchronous, pool_size=pool_size)
 
     @classmethod
     def from_env(cls, paths: PathsConfig) -> "DatabaseConfig":
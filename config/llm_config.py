@@ -6,10 +6,13 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Mapping
 import os
+import sys
 
+from config.coercion import env_bool, to_bool, to_int
 
-API_BACKENDS = {"remote_api", "local_api"}
-RUNTIME_BACKENDS = {"onnxruntime", "openvino"}
+
+API_BACKENDS = frozenset({"remote_api", "local_api"})
+RUNTIME_BACKENDS = frozenset({"onnxruntime", "openvino"})
 
 
 @dataclass(slots=True)
@@ -26,6 +29,13 @@ class LLMLocalRuntimeProfile:
     npu_device: str
     require_npu: bool
     onnx_provider: str | None
+    # OpenVINO INFERENCE_PRECISION_HINT (e.g. "f16", "bf16"); None keeps the
+    # device default. Weight precision such as int8/int4 comes from the
+    # exported model itself.
+    inference_precision: str | None = None
+    # Optional small model (folder under model_dir) used by OpenVINO for
+    # speculative decoding; it must share the main model's tokenizer.
+    draft_model: str | None = None
 
 
 @dataclass(slots=True)
@@ -44,6 +54,9 @@ class LLMConfig:
     require_npu: bool
     onnx_provider: str | None
 
+    # Seconds an answer stays in the on-disk response cache; 0 disables it.
+    response_cache_ttl: int = 0
+
     @classmethod
     def from_sources(
         cls,
@@ -78,24 +91,26 @@ class LLMConfig:
             runtime_section.get("model"),
             "qwen2.5-7b-instruct",
         )
-        runtime_model_dir_default = _resolve_path(
-            _to_str(runtime_section.get("model_dir"), str(root / "models")),
-            root,
-        )
         runtime_npu_device_default = _to_str(runtime_section.get("npu_device"), "NPU")
-        runtime_require_npu_default = _to_bool(runtime_section.get("require_npu"), True)
+        runtime_require_npu_default = to_bool(runtime_section.get("require_npu"), True)
         runtime_onnx_provider_default = _to_optional_str(runtime_section.get("onnx_provider"))
+        runtime_inference_precision_default = _to_optional_str(
+            runtime_section.get("inference_precision")
+        )
+        runtime_draft_model_default = _to_optional_str(runtime_section.get("draft_model"))
 
         runtime_model = os.getenv("LLM_LOCAL_RUNTIME_MODEL", runtime_model_default)
-        runtime_model_dir = _resolve_path(
-            os.getenv("LLM_LOCAL_RUNTIME_MODEL_DIR", runtime_model_dir_default),
-            root,
-        )
+        # The env override replaces the configured value before resolving,
+        # so the path is joined against the project root only once.
+        runtime_model_dir_raw = os.getenv("LLM_LOCAL_RUNTIME_MODEL_DIR")
+        if runtime_model_dir_raw is None:
+            runtime_model_dir_raw = _to_str(runtime_section.get("model_dir"), str(root / "models"))
+        runtime_model_dir = _resolve_path(runtime_model_dir_raw, root)
         runtime_npu_device = os.getenv(
             "LLM_LOCAL_RUNTIME_NPU_DEVICE",
             runtime_npu_device_default,
         ).strip() or "NPU"
-        runtime_require_npu = _read_env_bool(
+        runtime_require_npu = env_bool(
             "LLM_LOCAL_RUNTIME_REQUIRE_NPU",
             runtime_require_npu_default,
         )
@@ -103,6 +118,14 @@ class LLMConfig:
             "LLM_LOCAL_RUNTIME_ONNX_PROVIDER",
             runtime_onnx_provider_default,
         )
+        runtime_inference_precision = _read_optional_text(
+            "LLM_LOCAL_RUNTIME_INFERENCE_PRECISION",
+            runtime_inference_precision_default,
+        )
+        runtime_draft_model = _read_optional_text(
+            "LLM_LOCAL_RUNTIME_DRAFT_MODEL",
+            runtime_draft_model_default,
+        )
 
         local_runtime = LLMLocalRuntimeProfile(
             model=runtime_model.strip() or runtime_model_default,
@@ -110,6 +133,16 @@ class LLMConfig:
             npu_device=runtime_npu_device,
             require_npu=runtime_require_npu,
             onnx_provider=runtime_onnx_provider,
+            inference_precision=runtime_inference_precision,
+            draft_model=runtime_draft_model,
+        )
+
+        response_cache_ttl = max(
+            _read_env_int(
+                "LLM_RESPONSE_CACHE_TTL",
+                to_int(section.get("response_cache_ttl"), 0),
+            ),
+            0,
         )
 
         selected_api = local_api if backend == "local_api" else remote_api
@@ -129,6 +162,7 @@ class LLMConfig:
             npu_device=local_runtime.npu_device,
             require_npu=local_runtime.require_npu,
             onnx_provider=local_runtime.onnx_provider,
+            response_cache_ttl=response_cache_ttl,
         )
 
     @classmethod
@@ -154,7 +188,9 @@ def _build_api_profile(
 
 
 def _normalize_backend(raw: str) -> str:
-    text = raw.strip().lower()
+    # Interned so later backend checks against the (already interned)
+    # literal names match by identity instead of comparing characters.
+    text = sys.intern(raw.strip().lower())
     if text in API_BACKENDS or text in RUNTIME_BACKENDS:
         return text
     if text in {"", "openai", "api", "deepseek", "remote"}:
@@ -164,17 +200,11 @@ def _normalize_backend(raw: str) -> str:
     return text
 
 
-def _read_env_bool(name: str, default: bool) -> bool:
+def _read_env_int(name: str, default: int) -> int:
     value = os.getenv(name)
     if value is None:
         return default
-
-    normalized = value.strip().lower()
-    if normalized in {"1", "true", "yes", "on"}:
-        return True
-    if normalized in {"0", "false", "no", "off"}:
-        return False
-    return default
+    return to_int(value, default)
 
 
 def _read_optional_text(name: str, default: str | None = None) -> str | None:
@@ -204,20 +234,6 @@ def _to_optional_str(value: object) -> str | None:
     return text if text else None
 
 
-def _to_bool(value: object, default: bool) -> bool:
-    if isinstance(value, bool):
-        return value
-    if isinstance(value, (int, float)):
-        return bool(value)
-    if isinstance(value, str):
-        lowered = value.strip().lower()
-        if lowered in {"1", "true", "yes", "on"}:
-            return True
-        if lowered in {"0", "false", "no", "off"}:
-            return False
-    return default
-
-
 def _to_mapping(value: object) -> Mapping[str, object]:
     if isinstance(value, Mapping):
         return value
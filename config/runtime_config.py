@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, Mapping
 import os
 
@@ -12,11 +14,6 @@ from config.llm_config import LLMConfig
 from config.paths_config import PathsConfig
 from config.server_config import ServerConfig
 
-try:
-    import tomllib
-except ModuleNotFoundError:  # pragma: no cover
-    tomllib = None  # type: ignore[assignment]
-
 
 @dataclass(slots=True)
 class RuntimeConfig:
@@ -45,30 +42,52 @@ class RuntimeConfig:
         )
 
 
-def _load_root_config(project_root: Path) -> dict[str, Any]:
+def _load_root_config(project_root: Path) -> Mapping[str, Any]:
     config_name = os.getenv("APP_CONFIG_FILE", "app_config.toml").strip() or "app_config.toml"
     config_path = Path(config_name)
     if not config_path.is_absolute():
         config_path = project_root / config_path
 
-    if not config_path.exists():
+    try:
+        stat = config_path.stat()
+    except OSError:
         return {}
 
-    raw_text = config_path.read_text(encoding="utf-8-sig")
+    # Keyed by mtime and size, so an edited file is parsed again on next load.
+    return _parse_config_file(str(config_path), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=8)
+def _parse_config_file(config_path: str, mtime_ns: int, size: int) -> Mapping[str, Any]:
+    raw_text = Path(config_path).read_text(encoding="utf-8-sig")
 
-    if tomllib is not None:
-        parsed: Any = tomllib.loads(raw_text)
-    else:  # pragma: no cover
+    # Imported here so env-only deployments without a config file never
+    # load a TOML parser.
+    try:
+        import tomllib
+    except ModuleNotFoundError:  # pragma: no cover
         import toml
 
-        parsed = toml.loads(raw_text)
+        parsed: Any = toml.loads(raw_text)
+    else:
+        parsed = tomllib.loads(raw_text)
 
     if isinstance(parsed, dict):
-        return parsed
+        # Shared between loads, so every nested table is frozen as well.
+        return _freeze(parsed)
 
     raise ValueError(f"Invalid config format in {config_path}")
 
 
+def _freeze(value: Any) -> Any:
+    """Return a read-only copy of parsed TOML (tables and arrays included)."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
 def _section(data: Mapping[str, Any], key: str) -> Mapping[str, object]:
     value = data.get(key)
     if isinstance(value, Mapping):
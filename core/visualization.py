@@ -19,36 +19,45 @@ EDGE_COLORS: dict[str, str] = {
     ConnectionType.LEADS_TO.value: "#f4a259",
     ConnectionType.DERIVES_FROM.value: "#3f88c5",
 }
+DEFAULT_EDGE_COLOR = EDGE_COLORS[ConnectionType.RELATES.value]
 
 
 def build_vis_payload(nodes: list[Node], connections: list[Connection]) -> VisualizationPayload:
     """Convert domain objects to frontend-friendly datasets."""
+    # Pure string packaging per item; names are bound locally because this
+    # runs over the whole graph on every snapshot.
+    visual_node = VisualNode
     node_payload: list[VisualNode] = []
+    append_node = node_payload.append
     for index, node in enumerate(nodes, start=1):
-        node_label = node.summary or node.content[:24]
-        title_parts = [f"#{index}", node.content]
-        node_payload.append(
-            VisualNode(
+        content = node.content
+        position = node.position
+        size = node.size
+        append_node(
+            visual_node(
                 id=node.id,
-                label=f"{index}. {node_label}",
-                title="\n".join(part for part in title_parts if part),
-                x=node.position.x,
-                y=node.position.y,
+                label=f"{index}. {node.summary or content[:24]}",
+                title=f"#{index}\n{content}" if content else f"#{index}",
+                x=position.x,
+                y=position.y,
                 color=node.color,
-                value=max(node.size, 0.2),
+                value=0.2 if size < 0.2 else size,
                 confidence=node.confidence,
             )
         )
 
+    edge_color = EDGE_COLORS.get
+    visual_edge = VisualEdge
     edge_payload = [
-        VisualEdge(
+        visual_edge(
             id=conn.id,
             source=conn.source_id,
             target=conn.target_id,
             label=conn.conn_type,
             title=conn.description,
-            color=EDGE_COLORS.get(conn.conn_type, "#6c757d"),
-            width=max(conn.strength, 0.2) * 2,
+            color=edge_color(conn.conn_type, DEFAULT_EDGE_COLOR),
+            # Inline clamp instead of max(): no builtin call per edge.
+            width=(0.2 if conn.strength < 0.2 else conn.strength) * 2,
         )
         for conn in connections
     ]
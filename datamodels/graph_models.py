@@ -392,7 +392,7 @@ class NodeCreatePayload:
             color=_to_str(data.get("color"), "#157f83").strip() or "#157f83",
             size=max(_to_float(data.get("size"), 1.0), 0.2),
             tags=_to_str_list(data.get("tags")),
-            confidence=_to_float(data.get("confidence"), 1.0),
+            confidence=_to_unit_float(data.get("confidence"), 1.0),
             evidence=_to_str_list(data.get("evidence")),
             reason=_to_optional_str(data.get("reason")),
         )
@@ -423,7 +423,7 @@ class NodeUpdatePayload:
             color=_to_str(data.get("color"), "#157f83") if "color" in data else None,
             size=max(_to_float(data.get("size"), 1.0), 0.2) if "size" in data else None,
             tags=_to_str_list(data.get("tags")) if "tags" in data else None,
-            confidence=_to_float(data.get("confidence"), 1.0) if "confidence" in data else None,
+            confidence=_to_unit_float(data.get("confidence"), 1.0) if "confidence" in data else None,
             evidence=_to_str_list(data.get("evidence")) if "evidence" in data else None,
             reason=_to_optional_str(data.get("reason")),
             provided_fields=provided,
@@ -564,6 +564,10 @@ def _to_float(value: object, default: float) -> float:
     return default
 
 
+def _to_unit_float(value: object, default: float) -> float:
+    return min(max(_to_float(value, default), 0.0), 1.0)
+
+
 def _to_int(value: object, default: int) -> int:
     if isinstance(value, int):
         return value
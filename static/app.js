@@ -577,6 +577,16 @@ function fillSettingsForm(llmSettings = null) {
         runtimeOnnxProvider.value = String(localRuntime.onnx_provider || "");
     }
 
+    const runtimeInferencePrecision = document.getElementById("settings-runtime-inference-precision");
+    if (runtimeInferencePrecision) {
+        runtimeInferencePrecision.value = String(localRuntime.inference_precision || "");
+    }
+
+    const runtimeDraftModel = document.getElementById("settings-runtime-draft-model");
+    if (runtimeDraftModel) {
+        runtimeDraftModel.value = String(localRuntime.draft_model || "");
+    }
+
     const runtimeRequireNpu = document.getElementById("settings-runtime-require-npu");
     if (runtimeRequireNpu) {
         runtimeRequireNpu.checked = Boolean(localRuntime.require_npu);
@@ -605,6 +615,8 @@ function collectSettingsPayload() {
                 npu_device: (document.getElementById("settings-runtime-npu-device")?.value || "").trim(),
                 require_npu: Boolean(document.getElementById("settings-runtime-require-npu")?.checked),
                 onnx_provider: (document.getElementById("settings-runtime-onnx-provider")?.value || "").trim(),
+                inference_precision: (document.getElementById("settings-runtime-inference-precision")?.value || "").trim(),
+                draft_model: (document.getElementById("settings-runtime-draft-model")?.value || "").trim(),
             },
         },
     };
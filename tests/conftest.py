@@ -54,11 +54,12 @@ def temp_db_path() -> str:
     fd, path = tempfile.mkstemp(suffix=".db")
     os.close(fd)
     yield path
-    # Cleanup
-    try:
-        os.unlink(path)
-    except OSError:
-        pass
+    # Cleanup (WAL mode leaves -wal/-shm side files next to the database)
+    for candidate in (path, f"{path}-wal", f"{path}-shm"):
+        try:
+            os.unlink(candidate)
+        except OSError:
+            pass
 
 
 @pytest.fixture
@@ -55,3 +55,17 @@ def test_database_config_env_override_has_highest_priority(monkeypatch):
     config = DatabaseConfig.from_sources(paths=paths, data={"db_path": "data/custom.db"})
 
     assert config.db_path == str(project_root / "data" / "env_override.db")
+
+
+def test_database_config_reads_connection_settings(monkeypatch):
+    monkeypatch.delenv("THINKING_GRAPH_DB", raising=False)
+    paths = _build_paths(_make_project_root())
+
+    config = DatabaseConfig.from_sources(
+        paths=paths,
+        data={"synchronous": "full", "pool_size": "8"},
+    )
+    assert (config.synchronous, config.pool_size) == ("FULL", 8)
+
+    defaults = DatabaseConfig.from_sources(paths=paths, data={"pool_size": 0})
+    assert (defaults.synchronous, defaults.pool_size) == ("NORMAL", 1)
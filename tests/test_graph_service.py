@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import uuid
+
 import pytest
 
 from backend.services import GraphService
@@ -101,6 +103,41 @@ class TestGraphServiceNodes:
         result = graph_service.get_node("non-existent-id")
         assert result is None
 
+    def test_update_node_writes_only_provided_fields(
+        self,
+        graph_service: GraphService,
+        sample_node_payload: NodeCreatePayload,
+    ):
+        """Partial updates should keep untouched columns and bump the version."""
+        from datamodels.graph_models import NodeUpdatePayload
+
+        node = graph_service.create_node(sample_node_payload, actor="test-user")
+        moved = graph_service.update_node(
+            node.id,
+            NodeUpdatePayload.from_mapping({"position": {"x": 5, "y": 6}}),
+            actor="test-user",
+        )
+        assert moved is not None
+        assert moved.version == 2
+
+        stored = graph_service.get_node(node.id)
+        assert stored is not None
+        assert (stored.position.x, stored.position.y) == (5.0, 6.0)
+        assert stored.tags == ["test", "sample"]
+        assert stored.content == "Test node content"
+
+        graph_service.update_node(
+            node.id,
+            NodeUpdatePayload.from_mapping({"tags": ["renamed"], "confidence": 3}),
+            actor="test-user",
+        )
+        stored = graph_service.get_node(node.id)
+        assert stored is not None
+        assert stored.tags == ["renamed"]
+        assert stored.confidence == 1.0
+        assert (stored.position.x, stored.version) == (5.0, 3)
+        assert graph_service.verify_audit_integrity().ok
+
 
 class TestGraphServiceConnections:
     """Test suite for connection operations."""
@@ -184,3 +221,318 @@ class TestGraphServiceConnections:
         
         with pytest.raises(ValueError, match="Source/target node"):
             graph_service.create_connection(payload, actor="test-user")
+
+
+class TestGraphServiceTags:
+    """Test suite for JSON1-backed tag queries."""
+
+    def test_list_nodes_by_tag(
+        self,
+        graph_service: GraphService,
+        sample_node_payload: NodeCreatePayload,
+    ):
+        """Should match tags inside SQLite."""
+        tagged = graph_service.create_node(sample_node_payload, actor="test-user")
+        graph_service.create_node(
+            NodeCreatePayload(content="Untagged node", tags=[]),
+            actor="test-user",
+        )
+
+        matches = graph_service.list_nodes_by_tag("sample")
+        assert [node.id for node in matches] == [tagged.id]
+        assert graph_service.list_nodes_by_tag("missing") == []
+
+    def test_list_nodes_by_tag_skips_legacy_malformed_tags(
+        self,
+        graph_service: GraphService,
+        sample_node_payload: NodeCreatePayload,
+    ):
+        """Rows whose tags are not a valid JSON list should not match or fail the query."""
+        tagged = graph_service.create_node(sample_node_payload, actor="test-user")
+        legacy = graph_service.create_node(NodeCreatePayload(content="Legacy"), actor="test-user")
+        scalar = graph_service.create_node(NodeCreatePayload(content="Scalar"), actor="test-user")
+        with graph_service.repository.transaction() as conn:
+            conn.execute("PRAGMA ignore_check_constraints = ON")
+            try:
+                conn.execute("UPDATE nodes SET tags = 'not json' WHERE id = ?", (legacy.id,))
+                conn.execute("UPDATE nodes SET tags = '\"sample\"' WHERE id = ?", (scalar.id,))
+            finally:
+                conn.execute("PRAGMA ignore_check_constraints = OFF")
+
+        assert [node.id for node in graph_service.list_nodes_by_tag("sample")] == [tagged.id]
+
+
+class TestGraphServiceSnapshots:
+    """Test suite for import / save / load / clear flows."""
+
+    @staticmethod
+    def _build_pair(graph_service: GraphService) -> tuple[str, str]:
+        first = graph_service.create_node(
+            NodeCreatePayload(content="First", tags=["a"], evidence=["e1"]),
+            actor="test-user",
+        )
+        second = graph_service.create_node(
+            NodeCreatePayload(content="Second"),
+            actor="test-user",
+        )
+        graph_service.create_connection(
+            ConnectionCreatePayload(
+                source_id=first.id,
+                target_id=second.id,
+                conn_type=ConnectionType.SUPPORTS.value,
+                description="first supports second",
+            ),
+            actor="test-user",
+        )
+        return first.id, second.id
+
+    @staticmethod
+    def _store_legacy_value(graph_service: GraphService, node_id: str, column: str, raw: str) -> None:
+        # Databases created before the json_valid CHECK can hold such rows.
+        with graph_service.repository.transaction() as conn:
+            conn.execute("PRAGMA ignore_check_constraints = ON")
+            try:
+                conn.execute(f"UPDATE nodes SET {column} = ? WHERE id = ?", (raw, node_id))
+            finally:
+                conn.execute("PRAGMA ignore_check_constraints = OFF")
+
+    def test_import_tolerates_legacy_malformed_tags(self, graph_service: GraphService):
+        """Replacing a graph should audit legacy rows whose tags are not valid JSON."""
+        from datamodels.graph_models import AuditQuery, GraphImportPayload
+
+        first_id, _ = self._build_pair(graph_service)
+        self._store_legacy_value(graph_service, first_id, "tags", "a,b")
+
+        result = graph_service.import_graph(
+            GraphImportPayload.from_mapping({"nodes": [{"content": "Fresh"}], "connections": []}),
+            actor="test-user",
+        )
+
+        assert result.node_count == 1
+        delete = graph_service.list_audits(
+            AuditQuery(entity_type="node", entity_id=first_id, limit=10)
+        )[0]
+        assert delete.action == "delete"
+        assert delete.before_state["tags"] == []
+        assert delete.before_state["evidence"] == ["e1"]
+
+    def test_import_replaces_graph_and_remaps_ids(self, graph_service: GraphService):
+        """Import should soft-delete the current graph and insert fresh ids."""
+        from datamodels.graph_models import GraphImportPayload
+
+        self._build_pair(graph_service)
+        exported = graph_service.export_graph()
+
+        result = graph_service.import_graph(
+            GraphImportPayload.from_mapping(
+                {"nodes": exported.nodes, "connections": exported.connections}
+            ),
+            actor="test-user",
+        )
+
+        assert result.node_count == 2
+        assert result.connection_count == 1
+        snapshot = graph_service.graph_snapshot()
+        assert sorted(node.content for node in snapshot.nodes) == ["First", "Second"]
+        assert {node.id for node in snapshot.nodes}.isdisjoint(
+            {str(item["id"]) for item in exported.nodes}
+        )
+        assert all(uuid.UUID(node.id).version == 4 for node in snapshot.nodes)
+        first = next(node for node in snapshot.nodes if node.content == "First")
+        assert first.tags == ["a"]
+        assert first.evidence == ["e1"]
+        edge = snapshot.connections[0]
+        assert {edge.source_id, edge.target_id} == {node.id for node in snapshot.nodes}
+        assert len(graph_service.list_nodes(include_deleted=True)) == 4
+        assert graph_service.verify_audit_integrity().ok
+
+        from datamodels.graph_models import AuditQuery
+
+        original = exported.nodes[0]
+        deletes = graph_service.list_audits(
+            AuditQuery(entity_type="node", entity_id=str(original["id"]), limit=10)
+        )
+        assert deletes[0].action == "delete"
+        assert deletes[0].before_state == original
+        assert deletes[0].after_state == {
+            **original,
+            "version": int(original["version"]) + 1,
+            "updated_at": deletes[0].created_at,
+            "is_deleted": True,
+        }
+
+    def test_save_load_and_clear_round_trip(self, graph_service: GraphService):
+        """Saved snapshots should restore after the graph is cleared."""
+        from datamodels.graph_models import GraphClearPayload, GraphLoadPayload, GraphSavePayload
+
+        self._build_pair(graph_service)
+        saved = graph_service.save_graph(GraphSavePayload(name="demo"), actor="test-user")
+        assert (saved.node_count, saved.connection_count) == (2, 1)
+        assert [item.name for item in graph_service.list_saved_graphs()] == ["demo"]
+
+        cleared = graph_service.clear_graph(GraphClearPayload(), actor="test-user")
+        assert (cleared.cleared_nodes, cleared.cleared_connections) == (2, 1)
+        assert graph_service.list_nodes() == []
+
+        loaded = graph_service.load_graph(GraphLoadPayload(name="demo"), actor="test-user")
+        assert len(loaded.snapshot.nodes) == 2
+        assert len(loaded.snapshot.connections) == 1
+        assert graph_service.verify_audit_integrity().ok
+
+        with pytest.raises(ValueError, match="saved graph not found"):
+            graph_service.load_graph(GraphLoadPayload(name="missing"), actor="test-user")
+
+    def test_save_tolerates_legacy_malformed_tags(self, graph_service: GraphService):
+        """Saving should serialize legacy rows with malformed tags as empty lists."""
+        from backend import loads_json
+        from datamodels.graph_models import GraphSavePayload
+
+        first_id, _ = self._build_pair(graph_service)
+        self._store_legacy_value(graph_service, first_id, "tags", "a,b")
+
+        saved = graph_service.save_graph(GraphSavePayload(name="legacy"), actor="test-user")
+
+        assert (saved.node_count, saved.connection_count) == (2, 1)
+        row = graph_service.repository.fetch_one(
+            "SELECT payload FROM graph_snapshots WHERE name = ?", ("legacy",)
+        )
+        nodes = loads_json(row["payload"])["nodes"]
+        assert next(node for node in nodes if node["id"] == first_id)["tags"] == []
+
+    def test_clear_tolerates_legacy_malformed_evidence(self, graph_service: GraphService):
+        """Clearing should still audit legacy rows whose evidence is not valid JSON."""
+        from datamodels.graph_models import AuditQuery, GraphClearPayload
+
+        first_id, _ = self._build_pair(graph_service)
+        self._store_legacy_value(graph_service, first_id, "evidence", "{bad")
+
+        cleared = graph_service.clear_graph(GraphClearPayload(), actor="test-user")
+
+        assert (cleared.cleared_nodes, cleared.cleared_connections) == (2, 1)
+        delete = graph_service.list_audits(
+            AuditQuery(entity_type="node", entity_id=first_id, limit=10)
+        )[0]
+        assert delete.before_state["evidence"] == []
+        assert delete.after_state["evidence"] == []
+
+    def test_clear_audits_match_model_states(self, graph_service: GraphService):
+        """Clear audits should use to_state(), normalizing legacy tag items and types."""
+        from datamodels.graph_models import AuditQuery, GraphClearPayload
+
+        first_id, _ = self._build_pair(graph_service)
+        self._store_legacy_value(graph_service, first_id, "tags", "[1, 2]")
+        with graph_service.repository.transaction() as conn:
+            conn.execute("UPDATE connections SET conn_type = 'legacy', strength = ?", (1 / 3,))
+
+        graph_service.clear_graph(GraphClearPayload(), actor="test-user")
+
+        node_delete = graph_service.list_audits(
+            AuditQuery(entity_type="node", entity_id=first_id, limit=10)
+        )[0]
+        assert node_delete.before_state["tags"] == ["1", "2"]
+        edge_delete = graph_service.list_audits(AuditQuery(entity_type="connection", limit=10))[0]
+        assert edge_delete.before_state["conn_type"] == ConnectionType.RELATES.value
+        assert edge_delete.before_state["strength"] == 1 / 3
+        assert edge_delete.after_state == {
+            **edge_delete.before_state,
+            "version": edge_delete.before_state["version"] + 1,
+            "updated_at": edge_delete.created_at,
+            "is_deleted": True,
+        }
+
+    def test_saved_payload_matches_model_states(self, graph_service: GraphService):
+        """The saved snapshot payload should equal the live to_state output."""
+        from backend import loads_json
+        from datamodels.graph_models import GraphSavePayload
+
+        self._build_pair(graph_service)
+        graph_service.save_graph(GraphSavePayload(name="demo", reason="why"), actor="test-user")
+
+        row = graph_service.repository.fetch_one(
+            "SELECT payload FROM graph_snapshots WHERE name = ?", ("demo",)
+        )
+        payload = loads_json(row["payload"])
+        snapshot = graph_service.graph_snapshot()
+        assert payload["name"] == "demo"
+        assert payload["reason"] == "why"
+        assert payload["nodes"] == [node.to_state() for node in snapshot.nodes]
+        assert payload["connections"] == [edge.to_state() for edge in snapshot.connections]
+
+    def test_saved_payload_keeps_full_float_precision(self, graph_service: GraphService):
+        """Saving then loading should return positions and strengths unrounded."""
+        from datamodels.graph_models import GraphLoadPayload, GraphSavePayload
+
+        first_id, _ = self._build_pair(graph_service)
+        with graph_service.repository.transaction() as conn:
+            conn.execute(
+                "UPDATE nodes SET position_x = ?, position_y = ? WHERE id = ?",
+                (0.1 + 0.2, 123.456789012345678, first_id),
+            )
+            conn.execute("UPDATE connections SET strength = ?", (1 / 3,))
+
+        graph_service.save_graph(GraphSavePayload(name="precise"), actor="test-user")
+        loaded = graph_service.load_graph(GraphLoadPayload(name="precise"), actor="test-user")
+
+        first = next(node for node in loaded.snapshot.nodes if node.content == "First")
+        assert (first.position.x, first.position.y) == (0.1 + 0.2, 123.456789012345678)
+        assert loaded.snapshot.connections[0].strength == 1 / 3
+
+    def test_export_audits_counts_match_records(self, graph_service: GraphService):
+        """Audit export counts should match a pass over the exported records."""
+        from datamodels.graph_models import AuditQuery
+
+        first_id, _ = self._build_pair(graph_service)
+        graph_service.delete_node(first_id, actor="other-user")
+
+        report = graph_service.export_audits(AuditQuery(limit=4))
+        assert report.record_count == 4
+        expected: dict[str, dict[str, int]] = {"entity": {}, "action": {}, "actor": {}}
+        for record in report.audits:
+            for dimension, value in (
+                ("entity", record.entity_type),
+                ("action", record.action),
+                ("actor", record.actor),
+            ):
+                expected[dimension][value] = expected[dimension].get(value, 0) + 1
+        assert list(report.entity_counts.items()) == list(expected["entity"].items())
+        assert list(report.action_counts.items()) == list(expected["action"].items())
+        assert list(report.actor_counts.items()) == list(expected["actor"].items())
+
+        filtered = graph_service.export_audits(AuditQuery(entity_type="connection"))
+        assert filtered.entity_counts == {"connection": 2}
+        assert filtered.action_counts == {"delete": 1, "create": 1}
+
+    def test_audit_integrity_reports_unaudited_entities(self, graph_service: GraphService):
+        """Entities written without audits should be reported per entity."""
+        self._build_pair(graph_service)
+        with graph_service.repository.transaction() as conn:
+            conn.execute(
+                "INSERT INTO nodes (id, content, created_at, updated_at, is_deleted) "
+                "VALUES (?, ?, ?, ?, 1)",
+                ("ghost", "x", "2026-01-01T00:00:00Z", "2026-01-01T00:00:00Z"),
+            )
+
+        report = graph_service.verify_audit_integrity()
+        assert not report.ok
+        assert report.issues == [
+            "node:ghost missing create audit.",
+            "node:ghost missing delete audit.",
+        ]
+
+        with graph_service.repository.transaction() as conn:
+            conn.execute(
+                "UPDATE audits SET after_state = '' WHERE entity_type = 'connection' AND action = 'create'"
+            )
+        issues = graph_service.verify_audit_integrity().issues
+        assert any(issue.endswith("create audit missing after_state.") for issue in issues)
+
+    def test_delete_node_cascades_to_connections(self, graph_service: GraphService):
+        """Deleting a node should soft-delete its live connections with audits."""
+        first_id, _ = self._build_pair(graph_service)
+
+        assert graph_service.delete_node(first_id, actor="test-user") is True
+        assert graph_service.list_connections() == []
+        deleted_edges = graph_service.list_connections(include_deleted=True)
+        assert len(deleted_edges) == 1
+        assert deleted_edges[0].version == 2
+        assert graph_service.verify_audit_integrity().ok
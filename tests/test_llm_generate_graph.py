@@ -119,3 +119,20 @@ def test_normalize_generated_payload_enforces_confidence_variation():
     assert len(confidences) == 3
     assert all(0.0 <= value <= 1.0 for value in confidences)
     assert len({round(value, 3) for value in confidences}) >= 2
+
+
+def test_normalize_generated_payload_suffixes_duplicate_ids():
+    service = LLMService.__new__(LLMService)
+    payload = {
+        "nodes": [
+            {"id": "n", "content": "A"},
+            {"id": "n", "content": "B"},
+            {"id": "n_2", "content": "C"},
+            {"id": "n", "content": "D"},
+        ],
+        "connections": [],
+    }
+
+    nodes, _ = service._normalize_generated_graph_payload(payload, max_nodes=10, language="en")
+
+    assert [node["id"] for node in nodes] == ["n", "n_2", "n_2_2", "n_3"]
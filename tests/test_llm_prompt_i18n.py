@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import pytest
+
 from backend.i18n import (
     get_llm_prompt_items,
     get_llm_prompt_text,
@@ -44,3 +46,8 @@ def test_render_generate_graph_prompt_template_uses_runtime_values():
 def test_get_llm_prompt_text_fallback_to_default_language():
     prompt = get_llm_prompt_text("fr", "review_system_prompt")
     assert "JSON" in prompt
+
+
+def test_missing_prompt_key_raises_key_error():
+    with pytest.raises(KeyError, match="Missing LLM prompt key"):
+        get_llm_prompt_text("en", "no_such_prompt_key")
@@ -0,0 +1,271 @@
+"""Tests for LLMService request handling."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import replace
+from types import SimpleNamespace
+
+from backend.services.llm_service import API_CLIENT_CACHE_SIZE, LLMService
+from config import LLMConfig
+from datamodels.ai_llm_models import LLMChatRequest
+
+
+class _CountingCompletions:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def create(self, **kwargs: object) -> SimpleNamespace:
+        self.calls += 1
+        message = SimpleNamespace(content=f"answer {self.calls}")
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+def _api_service() -> tuple[LLMService, _CountingCompletions]:
+    service = LLMService(LLMConfig.from_sources({}), backend="disabled")
+    completions = _CountingCompletions()
+    service.backend = "remote_api"
+    service.model = "fake-model"
+    service._client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    return service, completions
+
+
+def test_ask_reuses_cached_answer_for_identical_prompt():
+    service, completions = _api_service()
+    request = LLMChatRequest(prompt="What is a thinking graph?", temperature=0.2)
+
+    first = service.ask(request)
+    second = service.ask(LLMChatRequest(prompt="What is a thinking graph?  ", temperature=0.2))
+
+    assert first.response == second.response == "answer 1"
+    assert completions.calls == 1
+
+    service.ask(LLMChatRequest(prompt="What is a thinking graph?", temperature=0.2, max_tokens=50))
+    assert completions.calls == 2
+
+
+def test_ask_skips_cache_for_hot_sampling():
+    service, completions = _api_service()
+    request = LLMChatRequest(prompt="Brainstorm", temperature=0.9)
+
+    assert service.ask(request).response == "answer 1"
+    assert service.ask(request).response == "answer 2"
+    assert completions.calls == 2
+
+
+def test_rule_based_conflicts_flag_every_edge_of_contradictory_pair():
+    from datamodels.graph_models import Connection, GraphSnapshot, Node, VisualizationPayload
+
+    first = Node(content="A", id="a")
+    second = Node(content="B", id="b")
+    connections = [
+        Connection(source_id="a", target_id="b", conn_type="supports", id="c1"),
+        Connection(source_id="a", target_id="b", conn_type="relates", id="c2"),
+        Connection(source_id="a", target_id="b", conn_type="opposes", id="c3"),
+        Connection(source_id="b", target_id="a", conn_type="supports", id="c4"),
+        Connection(source_id="b", target_id="b", conn_type="relates", id="loop"),
+    ]
+    snapshot = GraphSnapshot(
+        nodes=[first, second],
+        connections=connections,
+        visualization=VisualizationPayload(nodes=[], edges=[]),
+    )
+
+    service = LLMService.__new__(LLMService)
+    conflicts, structural = service._rule_based_conflicts(snapshot, language="en")
+
+    assert [conflict.entity_id for conflict in conflicts] == ["loop", "c1", "c2", "c3"]
+    assert structural
+    assert "a -> b" in conflicts[1].reason
+
+
+def test_ask_many_preserves_input_order():
+    service, _ = _api_service()
+    service._ask_api = lambda payload: payload.prompt.upper()
+    requests = [LLMChatRequest(prompt=f"question {index}", temperature=0.9) for index in range(5)]
+
+    answers = service.ask_many(requests, concurrency=3)
+
+    assert [answer.response for answer in answers] == [f"QUESTION {index}" for index in range(5)]
+    assert service.ask_many([]) == []
+
+
+def test_graph_context_keeps_question_last():
+    from datamodels.graph_models import GraphSnapshot, Node, VisualizationPayload
+
+    service = LLMService.__new__(LLMService)
+    snapshot = GraphSnapshot(
+        nodes=[Node(content="A", id="a")],
+        connections=[],
+        visualization=VisualizationPayload(nodes=[], edges=[]),
+    )
+
+    merged = service._attach_graph_context(
+        LLMChatRequest(prompt="Why A?", system_prompt="Be brief.", language="en"),
+        snapshot,
+    )
+
+    assert merged.prompt.startswith("[CURRENT_THINKING_GRAPH_JSON]")
+    assert merged.prompt.endswith("User question:\nWhy A?")
+    assert merged.system_prompt is not None
+    assert merged.system_prompt.startswith("Be brief.\n\n")
+
+
+def test_extract_json_payload_skips_surrounding_prose():
+    extract = LLMService._extract_json_payload
+
+    assert extract('```json\n{"nodes": []}\n```') == {"nodes": []}
+    assert extract('```JSON {"nodes": [1]}```') == {"nodes": [1]}
+    assert extract('```\n{"nodes": [2]}\n```') == {"nodes": [2]}
+    assert extract('Sure! {"graph": {"nodes": []}} Let me know {if} needed.') == {"graph": {"nodes": []}}
+    assert extract('{broken} then {"summary": "ok"}') == {"summary": "ok"}
+    assert extract("[1, 2]") is None
+    assert extract("no json here") is None
+
+
+def test_ask_many_batches_local_runtime_by_sampling_settings():
+    class _BatchBackend:
+        def __init__(self) -> None:
+            self.batches: list[list[str]] = []
+
+        def generate_batch(self, prompts, *, system_prompts, temperature, max_new_tokens):
+            self.batches.append(list(prompts))
+            return [f"{prompt}:{max_new_tokens}" for prompt in prompts]
+
+    service = LLMService(LLMConfig.from_sources({}), backend="disabled")
+    backend = _BatchBackend()
+    service.backend = "openvino"
+    service.model = "local"
+    service._local_backend = backend
+
+    answers = service.ask_many(
+        [
+            LLMChatRequest(prompt="a", max_tokens=64),
+            LLMChatRequest(prompt="b", max_tokens=512),
+            LLMChatRequest(prompt="c", max_tokens=64),
+        ]
+    )
+
+    assert [answer.response for answer in answers] == ["a:64", "b:512", "c:64"]
+    assert backend.batches == [["a", "c"], ["b"]]
+    assert service.ask(LLMChatRequest(prompt="a", max_tokens=64)).response == "a:64"
+
+
+def test_review_skips_model_when_structure_is_broken():
+    from datamodels.graph_models import Connection, GraphSnapshot, Node, VisualizationPayload
+
+    service, completions = _api_service()
+    snapshot = GraphSnapshot(
+        nodes=[Node(content="A", id="a")],
+        connections=[Connection(source_id="a", target_id="missing", id="dangling")],
+        visualization=VisualizationPayload(nodes=[], edges=[]),
+    )
+
+    review = service.review_graph(snapshot, language="en")
+
+    assert completions.calls == 0
+    assert review.verdict == "CONFLICT"
+    assert [conflict.entity_id for conflict in review.conflicts] == ["dangling"]
+    assert "non-existing node" in review.response
+
+
+def test_response_cache_is_shared_through_disk(tmp_path):
+    cache_path = str(tmp_path / "llm_cache.db")
+    config = replace(LLMConfig.from_sources({}), response_cache_ttl=60)
+    request = LLMChatRequest(prompt="Summarize the graph", temperature=0.1)
+
+    first = LLMService(config, backend="disabled", response_cache_path=cache_path)
+    first_calls = _CountingCompletions()
+    first.backend, first.model = "remote_api", "fake-model"
+    first._client = SimpleNamespace(chat=SimpleNamespace(completions=first_calls))
+    assert first.ask(request).response == "answer 1"
+
+    second = LLMService(config, backend="disabled", response_cache_path=cache_path)
+    second_calls = _CountingCompletions()
+    second.backend, second.model = "remote_api", "fake-model"
+    second._client = SimpleNamespace(chat=SimpleNamespace(completions=second_calls))
+    assert second.ask(request).response == "answer 1"
+    assert second_calls.calls == 0
+
+
+def test_api_client_is_shared_between_services():
+    config = LLMConfig.from_sources({})
+
+    first = LLMService(config, backend="local_api")
+    second = LLMService(config, backend="local_api")
+    other = LLMService(config, backend="local_api", base_url="http://127.0.0.1:9/v1")
+
+    assert first._client is not None
+    assert first._client is second._client
+    assert other._client is not first._client
+
+
+def test_heuristic_conflicts_match_keywords_in_any_case():
+    heuristic = LLMService._heuristic_conflicts
+
+    assert heuristic(" Ok ") == []
+    assert heuristic("Looks fine to me.") == []
+    assert [conflict.reason for conflict in heuristic("Found a CONFLICT here")] == ["Found a CONFLICT here"]
+    assert len(heuristic("\u8282\u70b9\u51b2\u7a81")) == 1
+
+
+def test_normalize_hex_color_accepts_only_six_hex_digits():
+    normalize = LLMService._normalize_hex_color
+
+    assert normalize("#A1B2C3") == "#a1b2c3"
+    assert normalize("#12_34a") == "#157f83"
+    assert normalize("#+1234a") == "#157f83"
+    assert normalize("#12345") == "#157f83"
+    assert normalize(None) == "#157f83"
+
+
+def test_prompt_cache_key_separates_endpoints_and_skips_empty_answers():
+    service, completions = _api_service()
+    request = LLMChatRequest(prompt="Same question", temperature=0.0)
+    completions.create = lambda **kwargs: SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=""))]
+    )
+
+    assert service.ask(request).response == ""
+    assert service._prompt_cache.get(service._prompt_cache_key(request, None)) is None
+
+    first_key = service._prompt_cache_key(request, None)
+    service.base_url = "http://other-endpoint/v1"
+    assert service._prompt_cache_key(request, None) != first_key
+
+
+def test_contradictory_pair_alone_still_asks_the_model():
+    from datamodels.graph_models import Connection, GraphSnapshot, Node, VisualizationPayload
+
+    service, completions = _api_service()
+    snapshot = GraphSnapshot(
+        nodes=[Node(content="A", id="a"), Node(content="B", id="b")],
+        connections=[
+            Connection(source_id="a", target_id="b", conn_type="supports", id="c1"),
+            Connection(source_id="a", target_id="b", conn_type="opposes", id="c2"),
+        ],
+        visualization=VisualizationPayload(nodes=[], edges=[]),
+    )
+
+    conflicts, structural = service._rule_based_conflicts(snapshot, language="en")
+    review = service.review_graph(snapshot, language="en")
+
+    assert [conflict.entity_id for conflict in conflicts] == ["c1", "c2"]
+    assert not structural
+    assert completions.calls == 1
+    assert review.verdict == "CONFLICT"
+
+
+def test_shared_api_clients_are_bounded(monkeypatch):
+    monkeypatch.setattr(LLMService, "_client_cache", OrderedDict())
+    base_url = "http://localhost:1/v1"
+
+    kept = LLMService._shared_api_client("kept", base_url)
+    evicted = LLMService._shared_api_client("evicted", base_url)
+    for index in range(API_CLIENT_CACHE_SIZE - 1):
+        assert LLMService._shared_api_client("kept", base_url) is kept
+        LLMService._shared_api_client(f"key-{index}", base_url)
+
+    assert len(LLMService._client_cache) == API_CLIENT_CACHE_SIZE
+    assert LLMService._shared_api_client("kept", base_url) is kept
+    assert LLMService._shared_api_client("evicted", base_url) is not evicted
@@ -59,6 +59,20 @@ class TestSQLiteRepository:
         )
         assert result is None
 
+    def test_transaction_rolls_back_on_interrupt(self, repository: SQLiteRepository):
+        """An interrupt inside a transaction must not leak into the next one."""
+        insert = "INSERT INTO nodes (id, content, created_at, updated_at) VALUES (?, ?, ?, ?)"
+        with pytest.raises(KeyboardInterrupt):
+            with repository.transaction() as conn:
+                conn.execute(insert, ("aborted", "x", "2026-01-01T00:00:00Z", "2026-01-01T00:00:00Z"))
+                raise KeyboardInterrupt
+
+        with repository.transaction(immediate=True) as conn:
+            assert not conn.execute("SELECT 1 FROM nodes").fetchall()
+            conn.execute(insert, ("kept", "x", "2026-01-01T00:00:00Z", "2026-01-01T00:00:00Z"))
+
+        assert [row["id"] for row in repository.fetch_all("SELECT id FROM nodes")] == ["kept"]
+
     def test_fetch_one_returns_none_when_not_found(self, repository: SQLiteRepository):
         """fetch_one should return None for non-existent records."""
         result = repository.fetch_one(
@@ -95,8 +109,180 @@ class TestSQLiteRepository:
         expected_indexes = {
             "idx_connections_source",
             "idx_connections_target",
-            "idx_audits_entity",
+            "idx_audits_entity_action",
             "idx_audits_created_at",
             "idx_snapshots_saved_at",
+            "idx_connections_source_live",
+            "idx_connections_target_live",
+            "idx_connections_created_live",
+            "idx_nodes_created_live",
         }
         assert expected_indexes.issubset(index_names)
+        assert "idx_audits_entity" not in index_names
+
+    def test_pool_reuses_connections(self, repository: SQLiteRepository):
+        """Sequential reads should lease the same pooled connection."""
+        with repository._lease() as first:
+            pass
+        with repository._lease() as second:
+            pass
+        assert first is second
+
+    def test_pool_discards_connection_after_failed_query(self, repository: SQLiteRepository):
+        """A reader that raised while leased should not return to the pool."""
+        with pytest.raises(sqlite3.OperationalError):
+            with repository._lease() as conn:
+                failed = conn
+                conn.execute("SELECT * FROM missing_table")
+
+        with repository._lease() as conn:
+            assert conn is not failed
+
+    def test_read_connections_are_query_only(self, repository: SQLiteRepository):
+        """Reads should never be able to write through the reader pool."""
+        with pytest.raises(sqlite3.OperationalError):
+            repository.fetch_one(
+                "INSERT INTO nodes (id, content, created_at, updated_at) VALUES (?, ?, ?, ?)",
+                ("reader-write", "x", "2026-01-01T00:00:00Z", "2026-01-01T00:00:00Z"),
+            )
+
+    def test_transaction_visible_to_readers(self, repository: SQLiteRepository):
+        """Committed writer transactions should be visible to pooled readers."""
+        assert repository.fetch_one("SELECT id FROM nodes WHERE id = ?", ("shared",)) is None
+        with repository.transaction() as conn:
+            conn.execute(
+                "INSERT INTO nodes (id, content, created_at, updated_at) VALUES (?, ?, ?, ?)",
+                ("shared", "x", "2026-01-01T00:00:00Z", "2026-01-01T00:00:00Z"),
+            )
+        assert repository.fetch_one("SELECT id FROM nodes WHERE id = ?", ("shared",)) is not None
+
+    def test_connections_use_wal_journal(self, repository: SQLiteRepository):
+        """Pooled connections should run in WAL mode."""
+        row = repository.fetch_one("PRAGMA journal_mode")
+        assert row is not None
+        assert str(row[0]).lower() == "wal"
+
+    def test_connection_pragmas_applied(self, repository: SQLiteRepository):
+        """Readers and the writer should share the tuned connection settings."""
+        with repository._lease() as reader:
+            assert reader.execute("PRAGMA busy_timeout").fetchone()[0] == 30000
+            assert reader.execute("PRAGMA temp_store").fetchone()[0] == 2
+            assert reader.execute("PRAGMA synchronous").fetchone()[0] == 1
+        with repository.transaction() as writer:
+            assert writer.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+            assert writer.execute("PRAGMA cache_size").fetchone()[0] == -65536
+
+    def test_synchronous_mode_is_configurable(self, temp_db_path: str):
+        """The synchronous pragma should follow the constructor flag."""
+        durable = SQLiteRepository(db_path=temp_db_path, synchronous="full")
+        try:
+            with durable.transaction() as conn:
+                assert conn.execute("PRAGMA synchronous").fetchone()[0] == 2
+        finally:
+            durable.close()
+
+        with pytest.raises(ValueError):
+            SQLiteRepository(db_path=temp_db_path, synchronous="sometimes")
+
+    def test_iter_rows_and_batch(self, repository: SQLiteRepository):
+        """iter_rows should stream rows; fetch_all_batch should share one lease."""
+        with repository.transaction() as conn:
+            conn.executemany(
+                "INSERT INTO nodes (id, content, created_at, updated_at) VALUES (?, ?, ?, ?)",
+                [
+                    (f"n{index}", "x", "2026-01-01T00:00:00Z", "2026-01-01T00:00:00Z")
+                    for index in range(3)
+                ],
+            )
+
+        streamed = repository.iter_rows("SELECT id FROM nodes ORDER BY id")
+        assert next(streamed)["id"] == "n0"
+        streamed.close()
+        assert [
+            row["id"] for row in repository.iter_rows("SELECT id FROM nodes ORDER BY id", batch_size=2)
+        ] == [
+            "n0",
+            "n1",
+            "n2",
+        ]
+
+        node_rows, audit_rows = repository.fetch_all_batch(
+            (
+                ("SELECT id FROM nodes WHERE id != ? ORDER BY id", ("n1",)),
+                ("SELECT id FROM audits", ()),
+            )
+        )
+        assert [row["id"] for row in node_rows] == ["n0", "n2"]
+        assert audit_rows == []
+
+        assert list(repository.iter_rows("SELECT id FROM nodes ORDER BY id", tuples=True)) == [
+            ("n0",),
+            ("n1",),
+            ("n2",),
+        ]
+        (tuple_rows,) = repository.fetch_all_batch((("SELECT id FROM nodes WHERE id = ?", ("n1",)),), tuples=True)
+        assert tuple_rows == [("n1",)]
+
+    def test_schema_version_recorded_and_reused(self, temp_db_path: str):
+        """Re-opening an initialized database should skip the DDL script."""
+        from backend.repository import SCHEMA_VERSION
+
+        first = SQLiteRepository(db_path=temp_db_path)
+        row = first.fetch_one("PRAGMA user_version")
+        assert row is not None and row[0] == SCHEMA_VERSION
+        first.close()
+
+        second = SQLiteRepository(db_path=temp_db_path)
+        tables = {row["name"] for row in second.fetch_all("SELECT name FROM sqlite_master WHERE type='table'")}
+        assert {"nodes", "connections", "audits", "graph_snapshots"}.issubset(tables)
+
+    def test_fetch_all_tuples(self, repository: SQLiteRepository):
+        """Tuple fetches should expose the same column values as Row fetches."""
+        with repository.transaction() as conn:
+            conn.execute(
+                "INSERT INTO nodes (id, content, created_at, updated_at) VALUES (?, ?, ?, ?)",
+                ("tuple-node", "x", "2026-01-01T00:00:00Z", "2026-01-01T00:00:00Z"),
+            )
+
+        assert repository.fetch_all_tuples("SELECT id, content FROM nodes") == [("tuple-node", "x")]
+        # The shared connection keeps its Row factory for regular fetches.
+        assert repository.fetch_one("SELECT id FROM nodes")["id"] == "tuple-node"
+
+    def test_query_cache_invalidated_by_commit(self, repository: SQLiteRepository):
+        """Cached reads should be reused until a write transaction commits."""
+        query = "SELECT id FROM nodes ORDER BY id"
+        assert repository.fetch_all(query) == []
+        assert len(repository._query_cache) == 1
+
+        with repository.transaction() as conn:
+            conn.execute(
+                "INSERT INTO nodes (id, content, created_at, updated_at) VALUES (?, ?, ?, ?)",
+                ("cached", "x", "2026-01-01T00:00:00Z", "2026-01-01T00:00:00Z"),
+            )
+
+        assert [row["id"] for row in repository.fetch_all(query)] == ["cached"]
+        first = repository.fetch_one("SELECT id FROM nodes WHERE id = ?", ("cached",))
+        assert repository.fetch_one("SELECT id FROM nodes WHERE id = ?", ("cached",)) is first
+
+    def test_query_cache_sees_writes_from_other_connections(self, temp_db_path: str):
+        """A commit made through another repository on the file should evict cached reads."""
+        reader = SQLiteRepository(db_path=temp_db_path)
+        writer = SQLiteRepository(db_path=temp_db_path)
+        query = "SELECT id FROM nodes ORDER BY id"
+        assert reader.fetch_all(query) == []
+
+        with writer.transaction() as conn:
+            conn.execute(
+                "INSERT INTO nodes (id, content, created_at, updated_at) VALUES (?, ?, ?, ?)",
+                ("external", "x", "2026-01-01T00:00:00Z", "2026-01-01T00:00:00Z"),
+            )
+
+        assert [row["id"] for row in reader.fetch_all(query)] == ["external"]
+        reader.close()
+        writer.close()
+
+    def test_uncached_reads_are_not_stored(self, repository: SQLiteRepository):
+        """cache=False should bypass the read cache entirely."""
+        repository.fetch_all("SELECT id FROM nodes", cache=False)
+        repository.fetch_one("SELECT COUNT(*) FROM nodes", cache=False)
+        assert len(repository._query_cache) == 0
@@ -0,0 +1,52 @@
+"""Tests for root config file loading."""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from config.runtime_config import RuntimeConfig, _load_root_config, _parse_config_file
+
+
+def test_root_config_is_parsed_once_until_file_changes(tmp_path, monkeypatch):
+    monkeypatch.delenv("APP_CONFIG_FILE", raising=False)
+    config_path = tmp_path / "app_config.toml"
+    config_path.write_text('[server]\nport = 5001\n', encoding="utf-8")
+    _parse_config_file.cache_clear()
+
+    first = _load_root_config(tmp_path)
+    second = _load_root_config(tmp_path)
+
+    assert first is second
+    assert _parse_config_file.cache_info().misses == 1
+
+    config_path.write_text('[server]\nport = 5002\n', encoding="utf-8")
+    stat = config_path.stat()
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert _load_root_config(tmp_path)["server"]["port"] == 5002
+    assert RuntimeConfig.load(tmp_path).server.port == 5002
+
+
+def test_missing_root_config_yields_empty_mapping(tmp_path, monkeypatch):
+    monkeypatch.delenv("APP_CONFIG_FILE", raising=False)
+
+    assert _load_root_config(tmp_path) == {}
+
+
+def test_cached_root_config_sections_are_read_only(tmp_path, monkeypatch):
+    monkeypatch.delenv("APP_CONFIG_FILE", raising=False)
+    (tmp_path / "app_config.toml").write_text(
+        '[llm]\nbackend = "local_api"\n[llm.local_api]\nmodel = "m"\n',
+        encoding="utf-8",
+    )
+    _parse_config_file.cache_clear()
+
+    loaded = _load_root_config(tmp_path)
+
+    with pytest.raises(TypeError):
+        loaded["llm"]["backend"] = "remote_api"  # type: ignore[index]
+    with pytest.raises(TypeError):
+        loaded["llm"]["local_api"]["model"] = "other"  # type: ignore[index]
+    assert _load_root_config(tmp_path)["llm"]["backend"] == "local_api"
@@ -66,6 +66,42 @@ class TestAppRoutes:
         if response.status_code == 200:
             assert response.content_type == "application/json"
 
+    def test_api_nodes_filter_by_tag(self, test_client):
+        """GET /api/nodes?tag= should only list nodes carrying that tag."""
+        tagged = test_client.post("/api/nodes", json={"content": "Tagged", "tags": ["focus"]})
+        test_client.post("/api/nodes", json={"content": "Plain"})
+
+        response = test_client.get("/api/nodes?tag=focus")
+
+        assert response.status_code == 200
+        assert [node["id"] for node in response.get_json()["nodes"]] == [tagged.get_json()["id"]]
+
+    def test_llm_chat_stream_route(self, app_config: RuntimeConfig):
+        """Should relay streamed chunks as server-sent events."""
+        from backend.services import LLMService
+
+        app = create_app(app_config)
+        app.config["TESTING"] = True
+        service = LLMService(app_config.llm, backend="disabled")
+        app.extensions["llm_service"] = service
+        client = app.test_client()
+
+        disabled = client.post("/api/llm/chat/stream", json={"prompt": "hi"})
+        assert disabled.content_type == "application/json"
+        assert disabled.get_json()["enabled"] is False
+
+        service.backend = "local_api"
+        service.model = "fake-llm"
+        service._client = object()
+        service._stream_answer = lambda payload, cache_key: iter(["Hel", "lo"])
+        response = client.post("/api/llm/chat/stream", json={"prompt": "hi"})
+        assert response.mimetype == "text/event-stream"
+        body = response.get_data(as_text=True)
+        assert body.startswith('data: {"delta": "Hel"}')
+        assert body.endswith('event: done\ndata: {"model": "fake-llm"}\n\n')
+
+        assert client.post("/api/llm/chat/stream", json={"prompt": " "}).status_code == 400
+
 
 class TestFallbackBehavior:
     """Test repository fallback behavior."""
@@ -35,6 +35,8 @@ def create_local_llm_backend(
     device: str = "NPU",
     require_npu: bool = True,
     onnx_provider: str | None = None,
+    inference_precision: str | None = None,
+    draft_model_name: str | None = None,
 ):
     backend_name = backend.strip().lower()
     model_path = resolve_model_path(model_root=model_root, model_name=model_name)
@@ -54,6 +56,12 @@ def create_local_llm_backend(
             model_name=model_name,
             device=device,
             require_npu=require_npu,
+            inference_precision=inference_precision,
+            draft_model_path=(
+                resolve_model_path(model_root=model_root, model_name=draft_model_name)
+                if draft_model_name
+                else None
+            ),
         )
 
     raise ValueError(f"Unsupported local backend: {backend}")
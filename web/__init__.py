@@ -16,12 +16,16 @@ except ImportError:  # pragma: no cover
 from backend import SQLiteRepository
 from backend.services import GraphService, LLMService
 from config import RuntimeConfig
-from web.routes import web_bp
+from web.routes import LLM_RESPONSE_CACHE_FILE, web_bp
 
 
-def _build_repository_with_fallback(db_path: str) -> SQLiteRepository:
+def _build_repository_with_fallback(
+    db_path: str,
+    synchronous: str = "NORMAL",
+    pool_size: int = 5,
+) -> SQLiteRepository:
     try:
-        repository = SQLiteRepository(db_path=db_path)
+        repository = SQLiteRepository(db_path=db_path, pool_size=pool_size, synchronous=synchronous)
         with repository.transaction() as conn:
             conn.execute(
                 """
@@ -41,7 +45,11 @@ def _build_repository_with_fallback(db_path: str) -> SQLiteRepository:
         return repository
     except (sqlite3.OperationalError, OSError):
         fallback_db = str(Path(tempfile.gettempdir()) / "thinking_graph.db")
-        repository = SQLiteRepository(db_path=fallback_db)
+        repository = SQLiteRepository(
+            db_path=fallback_db,
+            pool_size=pool_size,
+            synchronous=synchronous,
+        )
         with repository.transaction() as conn:
             conn.execute(
                 """
@@ -73,13 +81,20 @@ def create_app(runtime_config: RuntimeConfig | None = None) -> Flask:
     if CORS is not None and config.server.enable_cors:
         CORS(app)
 
-    repository = _build_repository_with_fallback(config.database.db_path)
+    repository = _build_repository_with_fallback(
+        config.database.db_path,
+        config.database.synchronous,
+        config.database.pool_size,
+    )
     if str(repository.db_path) != str(config.database.db_path):
         config.database.db_path = str(repository.db_path)
 
     app.extensions["runtime_config"] = config
     app.extensions["graph_service"] = GraphService(repository)
-    app.extensions["llm_service"] = LLMService(config.llm)
+    app.extensions["llm_service"] = LLMService(
+        config.llm,
+        response_cache_path=str(Path(config.paths.data_dir) / LLM_RESPONSE_CACHE_FILE),
+    )
 
     app.register_blueprint(web_bp)
     return app
@@ -4,15 +4,24 @@ from __future__ import annotations
 
 from dataclasses import asdict, is_dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
+import json
 import os
-import re
 from typing import Mapping
 
-from flask import Blueprint, current_app, jsonify, render_template, request
+from flask import (
+    Blueprint,
+    Response,
+    current_app,
+    jsonify,
+    render_template,
+    request,
+    stream_with_context,
+)
 
 from backend.services import LLMService
 from config import LLMConfig
+from config.coercion import to_bool, to_int
 from config.llm_config import LLMAPIProfile, LLMLocalRuntimeProfile
 from datamodels.ai_llm_models import LLMChatRequest
 from datamodels.graph_models import (
@@ -39,9 +48,11 @@ from datamodels.graph_models import (
 web_bp = Blueprint("web", __name__)
 
 DEFAULT_NODE_COLOR = "#157f83"
+LLM_RESPONSE_CACHE_FILE = "llm_cache.db"
 SUPPORTED_LLM_BACKENDS: set[str] = {"remote_api", "local_api", "onnxruntime", "openvino"}
 DEFAULT_LLM_SETTINGS: dict[str, Any] = {
     "backend": "remote_api",
+    "response_cache_ttl": 0,
     "remote_api": {
         "api_key": "",
         "base_url": "https://api.openai.com/v1",
@@ -58,15 +69,12 @@ DEFAULT_LLM_SETTINGS: dict[str, Any] = {
         "npu_device": "NPU",
         "require_npu": True,
         "onnx_provider": "",
+        "inference_precision": "",
+        "draft_model": "",
     },
 }
 
-try:
-    import tomllib
-except ModuleNotFoundError:  # pragma: no cover
-    tomllib = None  # type: ignore[assignment]
-
-import toml
+_HEX_DIGITS = frozenset("0123456789abcdef")
 
 LLM_NODE_COLOR_PALETTE: tuple[str, ...] = (
     DEFAULT_NODE_COLOR,
@@ -82,7 +90,7 @@ def normalize_hex_color(value: object) -> str | None:
     if not isinstance(value, str):
         return None
     color = value.strip().lower()
-    if re.fullmatch(r"#(?:[0-9a-f]{6})", color):
+    if len(color) == 7 and color[0] == "#" and _HEX_DIGITS.issuperset(color[1:]):
         return color
     return None
 
@@ -133,20 +141,6 @@ def _as_str(value: object, default: str = "") -> str:
     return str(value).strip()
 
 
-def _as_bool(value: object, default: bool) -> bool:
-    if isinstance(value, bool):
-        return value
-    if isinstance(value, (int, float)):
-        return bool(value)
-    if isinstance(value, str):
-        lowered = value.strip().lower()
-        if lowered in {"1", "true", "yes", "on"}:
-            return True
-        if lowered in {"0", "false", "no", "off"}:
-            return False
-    return default
-
-
 def _normalize_llm_settings(raw: Mapping[str, object] | None) -> dict[str, Any]:
     section = raw or {}
     remote_api_raw = _as_mapping(section.get("remote_api"))
@@ -163,6 +157,10 @@ def _normalize_llm_settings(raw: Mapping[str, object] | None) -> dict[str, Any]:
 
     normalized = {
         "backend": backend,
+        "response_cache_ttl": max(
+            to_int(section.get("response_cache_ttl"), int(DEFAULT_LLM_SETTINGS["response_cache_ttl"])),
+            0,
+        ),
         "remote_api": {
             "api_key": _as_str(
                 remote_api_raw.get("api_key"),
@@ -204,14 +202,22 @@ def _normalize_llm_settings(raw: Mapping[str, object] | None) -> dict[str, Any]:
                 local_runtime_raw.get("npu_device"),
                 _as_str(runtime_defaults.get("npu_device"), ""),
             ),
-            "require_npu": _as_bool(
+            "require_npu": to_bool(
                 local_runtime_raw.get("require_npu"),
-                _as_bool(runtime_defaults.get("require_npu"), True),
+                to_bool(runtime_defaults.get("require_npu"), True),
             ),
             "onnx_provider": _as_str(
                 local_runtime_raw.get("onnx_provider"),
                 _as_str(runtime_defaults.get("onnx_provider"), ""),
             ),
+            "inference_precision": _as_str(
+                local_runtime_raw.get("inference_precision"),
+                _as_str(runtime_defaults.get("inference_precision"), ""),
+            ),
+            "draft_model": _as_str(
+                local_runtime_raw.get("draft_model"),
+                _as_str(runtime_defaults.get("draft_model"), ""),
+            ),
         },
     }
     return normalized
@@ -252,8 +258,10 @@ def _build_llm_config_from_settings(
             project_root,
         ),
         npu_device=_as_str(runtime_settings.get("npu_device"), "NPU"),
-        require_npu=_as_bool(runtime_settings.get("require_npu"), True),
+        require_npu=to_bool(runtime_settings.get("require_npu"), True),
         onnx_provider=_as_str(runtime_settings.get("onnx_provider"), "") or None,
+        inference_precision=_as_str(runtime_settings.get("inference_precision"), "") or None,
+        draft_model=_as_str(runtime_settings.get("draft_model"), "") or None,
     )
 
     backend = _as_str(normalized.get("backend"), "remote_api").lower()
@@ -275,9 +283,16 @@ def _build_llm_config_from_settings(
         npu_device=local_runtime.npu_device,
         require_npu=local_runtime.require_npu,
         onnx_provider=local_runtime.onnx_provider,
+        response_cache_ttl=int(normalized.get("response_cache_ttl", 0)),
     )
 
 
+def _llm_response_cache_path(runtime: Any) -> str | None:
+    if runtime is None or not hasattr(runtime, "paths"):
+        return None
+    return str(Path(runtime.paths.data_dir) / LLM_RESPONSE_CACHE_FILE)
+
+
 def _load_app_config(config_path: Path) -> dict[str, Any]:
     if not config_path.exists():
         return {}
@@ -286,10 +301,16 @@ def _load_app_config(config_path: Path) -> dict[str, Any]:
     if not raw_text.strip():
         return {}
 
-    if tomllib is not None:
-        parsed: Any = tomllib.loads(raw_text)
-    else:  # pragma: no cover
-        parsed = toml.loads(raw_text)
+    # TOML parsers are only needed by the settings endpoints, so they are
+    # imported on first use instead of at app start.
+    try:
+        import tomllib
+    except ModuleNotFoundError:  # pragma: no cover
+        import toml
+
+        parsed: Any = toml.loads(raw_text)
+    else:
+        parsed = tomllib.loads(raw_text)
 
     if not isinstance(parsed, dict):
         raise ValueError(f"invalid config format: {config_path}")
@@ -297,6 +318,8 @@ def _load_app_config(config_path: Path) -> dict[str, Any]:
 
 
 def _write_app_config(config_path: Path, document: Mapping[str, Any]) -> None:
+    import toml
+
     config_path.parent.mkdir(parents=True, exist_ok=True)
     rendered = toml.dumps(dict(document))
     if not rendered.endswith("\n"):
@@ -369,7 +392,6 @@ def get_settings():
 def update_settings():
     incoming = payload_mapping()
     llm_block = _as_mapping(incoming.get("llm")) if "llm" in incoming else incoming
-    llm_settings = _normalize_llm_settings(llm_block)
 
     config_path = app_config_path()
     try:
@@ -377,6 +399,13 @@ def update_settings():
     except Exception as exc:
         return jsonify(to_json_ready(ErrorResponse(error=f"failed to read app_config: {exc}"))), 500
 
+    if "response_cache_ttl" not in llm_block:
+        # The settings form does not edit the cache TTL; keep the stored value.
+        stored_ttl = _as_mapping(config_doc.get("llm")).get("response_cache_ttl")
+        if stored_ttl is not None:
+            llm_block = {**llm_block, "response_cache_ttl": stored_ttl}
+    llm_settings = _normalize_llm_settings(llm_block)
+
     config_doc["llm"] = llm_settings
 
     try:
@@ -394,7 +423,10 @@ def update_settings():
 
     if runtime is not None and hasattr(runtime, "llm"):
         runtime.llm = applied_llm
-    current_app.extensions["llm_service"] = LLMService(applied_llm)
+    current_app.extensions["llm_service"] = LLMService(
+        applied_llm,
+        response_cache_path=_llm_response_cache_path(runtime),
+    )
 
     return jsonify(
         {
@@ -409,7 +441,12 @@ def update_settings():
 def nodes():
     if request.method == "GET":
         include_deleted = request.args.get("include_deleted", "false").lower() == "true"
-        response = NodesResponse(nodes=graph_service().list_nodes(include_deleted=include_deleted))
+        tag = request.args.get("tag")
+        if tag:
+            node_list = graph_service().list_nodes_by_tag(tag, include_deleted=include_deleted)
+        else:
+            node_list = graph_service().list_nodes(include_deleted=include_deleted)
+        response = NodesResponse(nodes=node_list)
         return jsonify(to_json_ready(response))
 
     payload = NodeCreatePayload.from_mapping(payload_mapping())
@@ -603,6 +640,36 @@ def llm_chat():
     return jsonify(to_json_ready(answer))
 
 
+@web_bp.post("/api/llm/chat/stream")
+def llm_chat_stream():
+    payload = LLMChatRequest.from_mapping(payload_mapping())
+    service = llm_service()
+    try:
+        snapshot = graph_service().graph_snapshot()
+        chunks = service.ask_stream(payload, graph_snapshot=snapshot)
+    except ValueError as exc:
+        return jsonify(to_json_ready(ErrorResponse(error=str(exc)))), 400
+    except RuntimeError:
+        # Disabled backends answer with the same JSON body as /api/llm/chat.
+        return jsonify(to_json_ready(service.ask(payload)))
+
+    def events() -> Iterator[str]:
+        try:
+            for chunk in chunks:
+                yield f"data: {json.dumps({'delta': chunk}, ensure_ascii=False)}\n\n"
+        except Exception as exc:
+            error = json.dumps({"error": f"LLM request failed: {exc}"}, ensure_ascii=False)
+            yield f"event: error\ndata: {error}\n\n"
+            return
+        yield f"event: done\ndata: {json.dumps({'model': service.model})}\n\n"
+
+    return Response(
+        stream_with_context(events()),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @web_bp.post("/api/llm/generate-graph")
 def llm_generate_graph():
     payload = payload_mapping()